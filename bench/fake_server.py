@@ -0,0 +1,81 @@
+# bench/fake_server.py
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from bench.synthetic import prize_for
+
+PAGE = """<html><body>
+<div class="result"><span id="drawDate">{date}</span>
+<span id="1stPz">{prize}</span><span id="2ndPz">{second}</span><span id="3rdPz">{third}</span>
+</div></body></html>"""
+
+class FakeResultServer:
+    """
+    Pelayan HTTP tempatan yang meniru halaman gdlotto `_result.aspx`, supaya
+    update_draws boleh diukur tanpa rangkaian.
+
+    Guna sebagai context manager; url_template boleh terus dihantar ke
+    update_draws(url_template=...). `requests` mengira jumlah permintaan.
+    """
+
+    def __init__(self, seed=4, latency=0.0, missing=()):
+        self.seed = seed
+        self.latency = latency
+        self.missing = set(missing)   # tarikh tanpa result (contoh hari tiada draw)
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = None
+
+    @property
+    def url_template(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}/results/ajax/_result.aspx?past=1&d={{date}}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._count_lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlparse(self.path)
+                if url.path != '/results/ajax/_result.aspx':
+                    self.send_error(404)
+                    return
+                date_str = parse_qs(url.query).get('d', [''])[0]
+                prize = '' if date_str in server.missing else prize_for(date_str, server.seed)
+                body = PAGE.format(
+                    date=date_str, prize=prize,
+                    second=prize_for(date_str + '#2', server.seed),
+                    third=prize_for(date_str + '#3', server.seed),
+                ).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
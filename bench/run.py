@@ -0,0 +1,211 @@
+# bench/run.py
+"""
+Suite benchmark Breakcode4D atas sejarah draw sintetik (seeded).
+
+Jalankan dari root repo:
+    python -m bench.run                          # semua saiz, tulis bench_results.json
+    python -m bench.run --sizes 200,1000 --skip-update
+    python -m bench.run --compare bench_lama.json  # banding dengan run terdahulu
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from bench.synthetic import synthetic_draws, write_draws
+from core.backtest import backtest
+from core.store import build_snapshot, load_draws
+from core.strategy import STRATEGIES, generate_base
+from core.wheel import apply_filters, generate_wheel
+
+DEFAULT_SIZES = [200, 1000, 10000, 100000]
+DEFAULT_ROUNDS = [10, 50, 200]
+DEFAULT_UPDATE_DAYS = [30, 180]
+
+# 'gap' belum dilaksanakan (UnknownStrategy), jadi tidak diukur
+BENCH_STRATEGIES = [s for s in STRATEGIES if s != 'gap']
+
+def best_of(fn, repeat=3):
+    """Masa terbaik (saat) bagi satu panggilan fn."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def repeat_for(size):
+    return 5 if size <= 1000 else 3 if size <= 10000 else 1
+
+class Recorder:
+    def __init__(self, verbose=True):
+        self.results = []
+        self.verbose = verbose
+
+    def add(self, name, seconds, **params):
+        row = {'name': name, 'seconds': seconds, **params}
+        self.results.append(row)
+        if self.verbose:
+            extra = ' '.join(f"{k}={v}" for k, v in params.items())
+            print(f"{name:<28} {seconds * 1000:>10.2f} ms  {extra}", flush=True)
+
+# ===================== BENCHMARKS =====================
+def bench_load(rec, sizes, tmp_dir):
+    for n in sizes:
+        path = os.path.join(tmp_dir, f"draws_{n}.txt")
+        write_draws(path, synthetic_draws(n))
+        r = repeat_for(n)
+        rec.add('load_draws', best_of(lambda: load_draws(path), r), size=n)
+        draws = load_draws(path)
+        rec.add('build_snapshot', best_of(lambda: build_snapshot(draws), r), size=n)
+
+def bench_strategies(rec, sizes, recent_n=50):
+    for n in sizes:
+        view = build_snapshot(synthetic_draws(n)).draws
+        for method in BENCH_STRATEGIES:
+            rec.add('generate_base', best_of(lambda: generate_base(view, method, recent_n), repeat_for(n)),
+                    size=n, strategy=method, recent_n=recent_n)
+
+def bench_backtest(rec, sizes, rounds_list, recent_n=50):
+    for n in sizes:
+        view = build_snapshot(synthetic_draws(n)).draws
+        for rounds in rounds_list:
+            if n < rounds + 61:
+                continue
+            for method in BENCH_STRATEGIES:
+                rec.add('backtest', best_of(lambda: backtest(view, method, recent_n, backtest_rounds=rounds), 1),
+                        size=n, strategy=method, rounds=rounds, recent_n=recent_n)
+
+def bench_wheel(rec, sizes):
+    bases = {
+        '5x5x5x5': [[str(d) for d in range(5)]] * 4,
+        '10x10x10x10': [[str(d) for d in range(10)]] * 4,
+    }
+    for label, base in bases.items():
+        rec.add('generate_wheel', best_of(lambda: generate_wheel(base), 5), base=label)
+    for n in sizes:
+        snap = build_snapshot(synthetic_draws(n))
+        combos = generate_wheel(bases['10x10x10x10'])
+        for label, past in (('set_rebuilt', None), ('snapshot_index', snap.number_set)):
+            rec.add('apply_filters', best_of(lambda: apply_filters(
+                combos, snap.draws, True, True, False, True, True, 2, ['1', '2'], ['9'], past=past
+            ), repeat_for(n)), size=n, combos=len(combos), past=label)
+
+def bench_update(rec, days_list, concurrency, latency, tmp_dir):
+    # Import di sini: perlukan requests + bs4 (requirements.txt)
+    from bench.fake_server import FakeResultServer
+    from core.jobs import SingleFlight
+    from core.update import update_draws
+
+    for days in days_list:
+        end = date.today() - timedelta(days=days + 1)
+        with FakeResultServer(latency=latency) as server:
+            data_dir = tempfile.mkdtemp(dir=tmp_dir)
+            path = os.path.join(data_dir, 'draws.txt')
+            write_draws(path, synthetic_draws(60, end=end))
+            start = time.perf_counter()
+            update_draws(path, url_template=server.url_template)
+            elapsed = time.perf_counter() - start
+            rec.add('update_draws', elapsed, days=days, requests=server.requests,
+                    dates_per_s=round(days / elapsed, 1), latency_ms=latency * 1000)
+
+        # Ramai pengguna klik serentak: semua patut kongsi satu scrape
+        with FakeResultServer(latency=latency) as server:
+            data_dir = tempfile.mkdtemp(dir=tmp_dir)
+            path = os.path.join(data_dir, 'draws.txt')
+            write_draws(path, synthetic_draws(60, end=end))
+            flight = SingleFlight(update_draws, os.path.join(data_dir, '.update.lock'))
+            jobs = []
+            barrier = threading.Barrier(concurrency)
+
+            def click():
+                barrier.wait()
+                jobs.append(flight.submit(path, url_template=server.url_template))
+
+            threads = [threading.Thread(target=click) for _ in range(concurrency)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for job in jobs:
+                job.wait()
+            elapsed = time.perf_counter() - start
+            rec.add('update_single_flight', elapsed, days=days, callers=concurrency,
+                    jobs=len({job.id for job in jobs}), requests=server.requests,
+                    lines=len(load_draws(path)), latency_ms=latency * 1000)
+
+# ===================== COMPARE =====================
+def result_key(row):
+    return tuple(sorted((k, v) for k, v in row.items()
+                        if k not in ('seconds', 'requests', 'dates_per_s', 'jobs', 'lines')))
+
+def compare(old_path, results, threshold=1.2):
+    with open(old_path) as f:
+        old = {result_key(r): r['seconds'] for r in json.load(f)['results']}
+    regressions = 0
+    print(f"\n=== Banding dengan {old_path} ===")
+    for row in results:
+        before = old.get(result_key(row))
+        if not before:
+            continue
+        ratio = row['seconds'] / before
+        flag = '⚠️' if ratio > threshold else '  '
+        regressions += ratio > threshold
+        params = ' '.join(f"{k}={v}" for k, v in result_key(row) if k != 'name')
+        print(f"{flag} {row['name']:<24} x{ratio:5.2f}  {params}")
+    print(f"{regressions} regresi (> x{threshold})")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Breakcode4D")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="saiz sejarah draw, dipisah koma")
+    parser.add_argument('--rounds', default=','.join(map(str, DEFAULT_ROUNDS)),
+                        help="bilangan pusingan backtest, dipisah koma")
+    parser.add_argument('--update-days', default=','.join(map(str, DEFAULT_UPDATE_DAYS)))
+    parser.add_argument('--concurrency', type=int, default=8, help="pengguna serentak untuk update")
+    parser.add_argument('--latency', type=float, default=0.0, help="latensi fake server (saat)")
+    parser.add_argument('--skip-update', action='store_true', help="langkau benchmark update_draws")
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--compare', help="fail JSON run terdahulu untuk dibanding")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    rounds = [int(r) for r in args.rounds.split(',')]
+    rec = Recorder()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_load(rec, sizes, tmp_dir)
+        bench_strategies(rec, sizes)
+        bench_backtest(rec, sizes, rounds)
+        bench_wheel(rec, sizes)
+        if not args.skip_update:
+            bench_update(rec, [int(d) for d in args.update_days.split(',')],
+                         args.concurrency, args.latency, tmp_dir)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'rounds': rounds,
+        },
+        'results': rec.results,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Keputusan disimpan ke {args.out}")
+
+    if args.compare:
+        return 1 if compare(args.compare, rec.results) else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+# bench/synthetic.py
+
+import random
+from datetime import date, timedelta
+
+def synthetic_draws(n, seed=4, end=None):
+    """
+    Sejarah draw palsu yang boleh diulang (seeded), satu draw setiap hari.
+
+    Params:
+        n: int - bilangan draw
+        seed: int - seed penjana
+        end: date | None - tarikh draw terakhir (default semalam)
+
+    Return:
+        list[dict] - format sama seperti load_draws ({'date', 'number'}).
+    """
+    rng = random.Random(seed)
+    end = end or (date.today() - timedelta(days=1))
+    start = end - timedelta(days=n - 1)
+    return [
+        {'date': (start + timedelta(days=i)).isoformat(), 'number': f"{rng.randrange(10000):04d}"}
+        for i in range(n)
+    ]
+
+def write_draws(file_path, draws):
+    with open(file_path, 'w') as f:
+        for d in draws:
+            f.write(f"{d['date']} {d['number']}\n")
+
+def prize_for(date_str, seed=4):
+    """Nombor 1st prize deterministik untuk satu tarikh (digunakan oleh fake server)."""
+    return f"{random.Random(f'{seed}:{date_str}').randrange(10000):04d}"
@@ -1,13 +1,23 @@
 import streamlit as st
-import os
-import re
-import requests
-import itertools
+import time
 import pandas as pd
 from datetime import datetime, timedelta
-from collections import Counter, defaultdict
+from contextlib import contextmanager
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
+from core import perf
+from core.artifacts import artifact_entry, artifact_file, artifact_like_dislike, load_artifact
+from core.backtest import backtest, count_matched
+from core.crosspick import CrossPickEngine
+from core.drawlist import QUERY_HELP, query_draws, page_rows, page_count, position_stats
+from core.games import DEFAULT_GAME, GAMES, game_dir, game_file, ingest
+from core.hotcold import HotColdTracker
+from core.insight import ai_insight_batch, explain_from_batch
+from core.jobs import SingleFlight
+from core.perf import incr
+from core.store import DrawStore, file_version, load_base_from_file
+from core.strategy import (STRATEGIES, NotEnoughDraws, UnknownStrategy,
+                           generate_base as compute_base, generate_predictions_from_base)
+from core.wheel import apply_filters, generate_wheel
 
 # ===================== COUNTDOWN DRAW =====================
 def get_draw_countdown_from_last_8pm():
@@ -16,292 +26,196 @@ def get_draw_countdown_from_last_8pm():
     last_8pm = today_8pm - timedelta(days=1) if now < today_8pm else today_8pm
     return (last_8pm + timedelta(days=1)) - now
 
-# ===================== LOAD & SAVE FILE =====================
-def load_draws(file_path='data/draws.txt'):
-    if not os.path.exists(file_path):
-        return []
-    draws = []
-    with open(file_path, 'r') as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) == 2 and re.match(r"^\d{4}$", parts[1]):
-                draws.append({'date': parts[0], 'number': parts[1]})
-    return draws
-
-def save_base_to_file(base_digits, file_path='data/base.txt'):
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, 'w') as f:
-        for pick in base_digits:
-            f.write(' '.join(str(d) for d in pick) + '\n')
-
-def load_base_from_file(file_path='data/base.txt'):
-    if not os.path.exists(file_path):
-        return []
-    with open(file_path, 'r') as f:
-        return [line.strip().split() for line in f if line.strip()]
-
-# ===================== UPDATE DRAW =====================
-def get_1st_prize(date_str):
-    url = f"https://gdlotto.net/results/ajax/_result.aspx?past=1&d={date_str}"
-    try:
-        resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-        if resp.status_code != 200:
-            print(f"❌ Status bukan 200 untuk {date_str}: {resp.status_code}")
-            return None
-        soup = BeautifulSoup(resp.text, "html.parser")
-        prize_tag = soup.find("span", id="1stPz")
-        if prize_tag and prize_tag.text.strip().isdigit() and len(prize_tag.text.strip()) == 4:
-            return prize_tag.text.strip()
-        else:
-            print(f"❌ Tidak jumpa 1st Prize untuk {date_str}")
-            return None
-    except requests.RequestException as e:
-        print(f"❌ Ralat semasa request untuk {date_str}: {e}")
-        return None
-
-def update_draws(file_path='data/draws.txt', max_days_back=181):
-    draws = load_draws(file_path)
-    existing_dates = set(d['date'] for d in draws)
-    last_date = (datetime.today() - timedelta(max_days_back)
-                 if not draws else datetime.strptime(draws[-1]['date'], "%Y-%m-%d"))
-    yesterday = datetime.today() - timedelta(days=1)
-    current = last_date + timedelta(days=1)
-    added = []
-
-    # LANGKAH 1: Jana base_last.txt dari draw SEMALAM
-    if len(draws) >= 51:
-        base_sebelum = generate_base(draws[:-1], method='frequency', recent_n=50)
-        save_base_to_file(base_sebelum, 'data/base_last.txt')
-    else:
-        if os.path.exists('data/base_last.txt'):
-            os.remove('data/base_last.txt')
-
-    # LANGKAH 2: Tambah draw baru (jika ada)
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, 'a') as f:
-        while current.date() <= yesterday.date():
-            date_str = current.strftime("%Y-%m-%d")
-            if date_str in existing_dates:
-                current += timedelta(days=1)
-                continue
-            prize = get_1st_prize(date_str)
-            if prize:
-                f.write(f"{date_str} {prize}\n")
-                added.append({'date': date_str, 'number': prize})
-            current += timedelta(days=1)
-
-    # LANGKAH 3: Jana base.txt dari draw terkini
-    draws = load_draws(file_path)
-    if len(draws) >= 50:
-        base_terkini = generate_base(draws, method='frequency', recent_n=50)
-        save_base_to_file(base_terkini, 'data/base.txt')
-
-    return f"✔ {len(added)} draw baru ditambah." if added else "✔ Tiada draw baru ditambah."
-
 # ===================== STRATEGY BASE =====================
+# Logik strategi ada dalam core/; di sini hanya papar amaran Streamlit.
 def generate_base(draws, method='frequency', recent_n=50):
-    total = len(draws)
-
-    if method == "smartpattern":
-        # Semak minimum keperluan data untuk semua strategi dalam smartpattern
-        if total < 60:
-            st.warning(
-                f"⚠️ Tidak cukup data untuk strategi `{method}`. "
-                f"Minimum 60 draws diperlukan, tapi hanya {total} draws tersedia."
-            )
-            st.stop()
-
-        # Tetapan strategi & recent_n untuk setiap posisi (Pick 1–4)
-        setting = [
-            ('qaisara', 60),   # P1
-            ('hybrid', 45),    # P2
-            ('frequency', 50), # P3
-            ('hybrid', 35),    # P4
-        ]
-
-        result = []
-        for i, (strat, n) in enumerate(setting):
-            if total < n:
-                st.warning(f"❗ Tidak cukup draw untuk Pick {i+1} dengan strategi `{strat}` (perlu {n} draw).")
-                st.stop()
-            base = generate_base(draws, strat, recent_n=n)
-            result.append(base[i])
-        return result
-
-    # ========= STRATEGI BIASA =========
-    if total < recent_n:
-        st.warning(
-            f"⚠️ Tidak cukup data untuk strategi `{method}` dengan recent_n={recent_n}. "
-            f"Hanya {total} draw tersedia."
-        )
+    try:
+        return compute_base(draws, method=method, recent_n=recent_n)
+    except NotEnoughDraws as e:
+        st.warning(str(e))
         st.stop()
-
-    recent = [d['number'] for d in draws[-recent_n:]]
-
-    if method == "frequency":
-        freq = [Counter() for _ in range(4)]
-        for number in recent:
-            for i, d in enumerate(number):
-                freq[i][d] += 1
-        return [sorted(freq[i], key=freq[i].get, reverse=True)[:5] for i in range(4)]
-
-    elif method == "hybrid":
-        freq = [Counter() for _ in range(4)]
-        last_digits = [set() for _ in range(4)]
-        for number in recent:
-            for i, d in enumerate(number):
-                freq[i][d] += 1
-                if number == recent[-1]:  # draw terakhir
-                    last_digits[i].add(d)
-        hybrid = []
-        for i in range(4):
-            sorted_digits = sorted(freq[i], key=freq[i].get, reverse=True)
-            combined = [d for d in sorted_digits if d not in last_digits[i]]
-            hybrid.append(combined[:5])
-        return hybrid
-
-    elif method == "qaisara":
-        if total < recent_n:
-            st.warning(f"❗ Tidak cukup draw untuk strategi qaisara (perlu {recent_n} draw).")
-            st.stop()
-        base_hybrid = generate_base(draws, "hybrid", recent_n=recent_n)
-        base_freq = generate_base(draws, "frequency", recent_n=recent_n)
-
-        qaisara = []
-        for i in range(4):
-            score = defaultdict(int)
-            for idx, d in enumerate(base_freq[i]):
-                score[d] += (5 - idx)
-            for idx, d in enumerate(base_hybrid[i]):
-                score[d] += (5 - idx)
-            sorted_score = sorted(score.items(), key=lambda x: x[1], reverse=True)
-            selected = [d for d, _ in sorted_score]
-            if len(selected) >= 7:
-                selected = selected[1:-1]  # buang top 1 & bottom 1
-            qaisara.append(selected[:5])
-        return qaisara
-
-    else:
-        st.error(f"❌ Strategi tidak dikenali: {method}")
+    except UnknownStrategy as e:
+        st.error(f"❌ {e}")
         return [[] for _ in range(4)]
 
-    # ========== UNKNOWN ==========
-    st.warning(f"Strategi '{method}' tidak dikenali.")
-    return [['0'], ['0'], ['0'], ['0']]
-
 def run_backtest(draws, strategy='hybrid', recent_n=50, arah='Kiri ke Kanan (P1→P4)', backtest_rounds=10):
-    # Jumlah draw diperlukan mengikut strategi
-    min_required = {
-        'frequency': 50,
-        'gap': 120,
-        'hybrid': 50,
-        'qaisara': 60,
-        'smartai': 50,
-        'smartpattern': 60  # paling besar antara semua pick
-    }
-    required = min_required.get(strategy, 50)
-
-    if len(draws) < backtest_rounds + required:
-        st.warning(f"❗ Tidak cukup draw untuk backtest '{strategy}'. Sekurang-kurangnya {backtest_rounds + required} draw diperlukan.")
+    try:
+        results = backtest(draws, strategy, recent_n, arah, backtest_rounds)
+    except NotEnoughDraws as e:
+        st.warning(str(e))
+        return
+    except UnknownStrategy as e:
+        st.error(f"❌ {e}")
         return
-    # =============== BACKTEST ============
-    def match_insight(fp, base):
-        if arah == "Kanan ke Kiri (P4→P1)":
-            fp, base = fp[::-1], base[::-1]
-        return ["✅" if fp[i] in base[i] else "❌" for i in range(4)]
-
-    results = []
-    for i in range(backtest_rounds):
-        test_draw = draws[-(i+1)]
-        past_draws = draws[:-(i+1)]
-
-        try:
-            # Untuk strategi yang tak perlukan recent_n dihantar (urus sendiri)
-            if strategy in ['smartpattern']:
-                base = generate_base(past_draws, method=strategy)
-            else:
-                base = generate_base(past_draws, method=strategy, recent_n=recent_n)
-
-            insight = match_insight(test_draw['number'], base)
-            results.append({
-                "Tarikh": test_draw['date'],
-                "Result 1st": test_draw['number'],
-                "Insight": ' '.join(f"P{j+1}:{s}" for j, s in enumerate(insight))
-            })
-        except Exception as e:
-            results.append({
-                "Tarikh": test_draw['date'],
-                "Result 1st": test_draw['number'],
-                "Insight": f"⚠️ Ralat: {str(e)}"
-            })
-
     df = pd.DataFrame(results[::-1])
-    matched = sum("✅" in r["Insight"] for r in results if "Insight" in r and isinstance(r["Insight"], str))
+    matched = count_matched(results)
     st.success(f"🎯 Jumlah draw dengan sekurang-kurangnya satu digit match: {matched} daripada {backtest_rounds}")
     st.dataframe(df, use_container_width=True)
 
-# ===================== LIKE / DISLIKE ANALYSIS =====================
-def get_like_dislike_digits(draws, recent_n=30):
-    last = [d['number'] for d in draws[-recent_n:] if 'number' in d and len(d['number'])==4]
-    cnt = Counter()
-    for num in last: cnt.update(num)
-    mc = cnt.most_common()
-    like    = [d for d,_ in mc[:3]]
-    dislike = [d for d,_ in mc[-3:]] if len(mc) >= 3 else []
-    return like, dislike
-
-# ===================== PREDICTION DETERMINISTIK =====================
-def generate_predictions_from_base(base, max_preds=10):
-    combos = [''.join(p) for p in itertools.product(*base)]
-    return combos[:max_preds]
-
-# ===================== UI =====================
-st.set_page_config(page_title="Breakcode4D Predictor", layout="wide")
-st.markdown(f"⏳ Next draw: `{str(get_draw_countdown_from_last_8pm()).split('.')[0]}`")
-st.title("🔮 Breakcode4D Predictor (GD Lotto)")
-
-col1, col2 = st.columns(2)
-with col1:
-    if st.button("📥 Update Draw Terkini"):
-        msg = update_draws()
-        st.success(msg)
-        st.markdown("### 📋 Base Hari Ini")
-        st.code('\n'.join([' '.join(p) for p in load_base_from_file()]), language='text')
-with col2:
-    st.markdown("""
-    <a href="https://batman11.net/RegisterByReferral.aspx?MemberCode=BB1845" target="_blank">
-        <button style="width:100%;padding:0.6em;font-size:16px;background:#4CAF50;color:white;border:none;border-radius:5px;">
-            📝 Register Sini Batman 11 dan dapatkan BONUS!!!
-        </button>
-    </a>
-    """, unsafe_allow_html=True)
-
-draws = load_draws()
-if not draws:
-    st.warning("⚠️ Sila klik 'Update Draw Terkini' untuk mula. Proses ini hanya mengambil masa 1-5 minit sahaja.")
-else:
-    st.info(f"📅 Tarikh terakhir: **{draws[-1]['date']}** | 📊 Jumlah draw: **{len(draws)}**")
-    tabs = st.tabs(["📌 Insight", "🧠 Ramalan", "🔁 Backtest", "📋 Draw List", "🎡 Wheelpick"])
-
-    # ===================== TAB INSIGHT =====================
-    with tabs[0]:
+# ===================== CACHE =====================
+# Sejarah draw disimpan sekali untuk seluruh proses (DrawStore, dikongsi semua
+# sesi tanpa salinan). Hasil terbitan dikunci pada versi fail (mtime, saiz)
+# supaya rerun Streamlit tidak jana semula base yang sama.
+def current_game():
+    return st.session_state.get("game", DEFAULT_GAME)
+
+@st.cache_resource
+def get_store(file_path='data/draws.txt'):
+    return DrawStore(file_path, watch=True)
+
+def game_store():
+    return get_store(game_file(current_game()))
+
+@st.cache_resource
+def get_updater(game=DEFAULT_GAME):
+    return SingleFlight(ingest, game_file(game, '.update.lock'))
+
+def get_draws():
+    return game_store().snapshot().draws
+
+@st.cache_data(show_spinner=False)
+def cached_base_file(file_path, version):
+    incr('cache_miss:base_file')
+    return load_base_from_file(file_path)
+
+def get_base_from_file(name='base.txt'):
+    incr('cache_call:base_file')
+    file_path = game_file(current_game(), name)
+    return cached_base_file(file_path, file_version(file_path))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_base(version, method, recent_n, upto, _draws):
+    # upto = bilangan draw dari awal (None = semua), ganti draws[:upto]
+    incr('cache_miss:base')
+    draws = _draws if upto is None else _draws[:upto]
+    return generate_base(draws, method=method, recent_n=recent_n)
+
+def get_base(method='frequency', recent_n=50, upto=None):
+    incr('cache_call:base')
+    snap = game_store().snapshot()
+    # Guna artifak harian jika sudah dijana untuk draw yang sama
+    entry = artifact_entry(get_artifact(upto), snap.draws if upto is None else snap.draws[:upto],
+                           method, recent_n)
+    if entry:
+        return entry['base']
+    return cached_base(snap.version, method, recent_n, upto, snap.draws)
+
+def get_predictions(method='frequency', recent_n=50, max_preds=10):
+    entry = artifact_entry(get_artifact(), get_draws(), method, recent_n)
+    if entry and len(entry['predictions']) >= max_preds:
+        return entry['predictions'][:max_preds]
+    return generate_predictions_from_base(get_base(method, recent_n), max_preds=max_preds)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_artifact(file_path, version):
+    incr('cache_miss:artifact')
+    return load_artifact(file_path)
+
+def get_artifact(upto=None):
+    # Artifak 'as of' draw ke-upto (None = terkini); None jika belum dijana
+    incr('cache_call:artifact')
+    snap = game_store().snapshot()
+    upto = len(snap.dates) if upto is None else upto
+    if upto < 1:
+        return None
+    file_path = artifact_file(game_dir(current_game()), snap.dates[upto - 1])
+    return cached_artifact(file_path, file_version(file_path))
+
+@st.cache_resource
+def get_hotcold_tracker(game=DEFAULT_GAME):
+    return HotColdTracker()
+
+def hotcold_tracker():
+    # Tracker dikongsi semua sesi; hanya draw baru ditambah bila fail berubah
+    return get_hotcold_tracker(current_game()).sync(game_store().snapshot().numbers)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_draw_query(version, start, end, query, _snap):
+    incr('cache_miss:draw_query')
+    indices = query_draws(_snap.draws, start, end, query, dates=_snap.dates)
+    return indices, position_stats(_snap.draws, indices)
+
+def get_draw_query(start=None, end=None, query=''):
+    incr('cache_call:draw_query')
+    snap = game_store().snapshot()
+    return cached_draw_query(snap.version, start, end, query, snap)
+
+@st.cache_resource
+def get_crosspick_engine(game=DEFAULT_GAME):
+    return CrossPickEngine()
+
+def crosspick_engine():
+    # Engine dikongsi semua sesi; hanya draw baru ditambah bila fail berubah
+    return get_crosspick_engine(current_game()).sync(game_store().snapshot().numbers)
+
+@st.cache_resource(max_entries=2)
+def cached_insight_batch(version, _draws, window=50):
+    # Hasil kolum dikongsi tanpa salinan (baca sahaja)
+    incr('cache_miss:insight_batch')
+    engine = crosspick_engine()
+    numbers = [d['number'] for d in _draws]
+    def cross_pick(i):
+        return engine.cross_pick_data(numbers[i - 1], i - 1 - window, i - 1) if i else {}
+    return ai_insight_batch(_draws, cross_pick=cross_pick)
+
+def get_insight_batch():
+    incr('cache_call:insight_batch')
+    snap = game_store().snapshot()
+    return cached_insight_batch(snap.version, snap.draws)
+
+def clear_caches():
+    # Dipanggil selepas update_draws supaya semua sesi baca data baru
+    game_store().invalidate()
+    for fn in (cached_base_file, cached_base, cached_artifact, cached_draw_query, cached_insight_batch):
+        fn.clear()
+
+# ===================== VIEW TIMER =====================
+@contextmanager
+def view_timer(label):
+    # Masa render setiap paparan, untuk pastikan hanya paparan aktif dikira
+    start = time.perf_counter()
+    with perf.collect() as stats:
+        yield
+    parts = [f"⏱️ {label}: {(time.perf_counter() - start) * 1000:.1f} ms"]
+    if st.session_state.get("perf_panel"):
+        # Pecahan ikut peringkat, kerana fragment rerun tidak mengemas kini sidebar
+        parts += [f"{r['span']} {r['total_ms']} ms ×{r['count']}" for r in stats.rows()]
+        parts += [f"cache {name} {hit}/{calls}" for name, (hit, calls) in perf.cache_summary(stats).items()]
+    st.caption(" · ".join(parts))
+
+def render_perf_panel(stats):
+    st.sidebar.markdown("### 🐢 Prestasi Rerun Ini")
+    rows = stats.rows()
+    if rows:
+        st.sidebar.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    cache = perf.cache_summary(stats)
+    if cache:
+        st.sidebar.dataframe(pd.DataFrame(
+            [{'cache': name, 'hit': hit, 'panggilan': calls} for name, (hit, calls) in cache.items()]
+        ), use_container_width=True, hide_index=True)
+    st.sidebar.caption(f"🌐 Panggilan rangkaian: {stats.counters.get('network_calls', 0)}")
+    with st.sidebar.expander("Sejak proses mula"):
+        st.dataframe(pd.DataFrame(perf.TOTALS.rows()), use_container_width=True, hide_index=True)
+        st.caption(f"🌐 Panggilan rangkaian: {perf.TOTALS.counters.get('network_calls', 0)}")
+
+# ===================== VIEW INSIGHT =====================
+@st.fragment
+def render_insight(draws):
+    with view_timer("📌 Insight"):
         st.markdown("### 📌 Insight Terakhir")
-        
-        draws = load_draws()
-        if not draws:
-            st.warning("Tiada draw data dijumpai.")
-            st.stop()
 
         if len(draws) < 1:
             st.warning("❗ Data draw tidak cukup untuk analisis insight.")
             st.stop()
 
         last = draws[-1]
-        base = load_base_from_file('data/base_last.txt')
+        # Snapshot artifak 'as of' draw sebelumnya; base_last.txt jika artifak belum dijana
+        entry = artifact_entry(get_artifact(len(draws) - 1), draws[:-1], 'frequency', 50)
+        base = entry['base'] if entry else get_base_from_file('base_last.txt')
 
         if not base or len(base) != 4:
             st.warning(
-                "⚠️ Base terakhir (`base_last.txt`) belum wujud atau kosong.\n"
+                "⚠️ Base terakhir (artifak semalam / `base_last.txt`) belum wujud atau kosong.\n"
                 "Sila tekan 'Update Draw Terkini' dahulu dan pastikan draw sebelumnya telah lengkap."
             )
             st.stop()
@@ -325,7 +239,7 @@ else:
                             key="arah_insight_compare")
         
         recent_n = st.slider("📊 Bilangan draw digunakan untuk base:", 10, 100, 50, 5, key="recent_compare_slider")
-        strategi_list = ['frequency', 'gap', 'hybrid', 'qaisara', 'smartpattern']
+        strategi_list = STRATEGIES
 
         def match_insight_result(fp, base):
             if arah_uji == "Kanan ke Kiri (P4→P1)":
@@ -335,11 +249,10 @@ else:
         rows = []
         if len(draws) > recent_n:
             test_draw = draws[-1]
-            past_draws = draws[:-1]
 
             for strat in strategi_list:
                 try:
-                    base_test = generate_base(past_draws, method=strat, recent_n=recent_n)
+                    base_test = get_base(method=strat, recent_n=recent_n, upto=len(draws) - 1)
                     insight = match_insight_result(test_draw['number'], base_test)
                     rows.append({
                         "Strategi": strat,
@@ -356,41 +269,113 @@ else:
         else:
             st.warning("❗ Tidak cukup draw untuk analisis strategi.")
 
-    # ===================== TAB RAMALAN =====================
-    with tabs[1]:
+        # ===================== WHY SECTION =====================
+        st.markdown("---")
+        st.markdown("### 🔍 Kenapa Nombor Ini Naik?")
+        # date_input berjulat (bukan selectbox) supaya senarai semua tarikh tidak dihantar ke browser
+        first = datetime.strptime(draws[0]['date'], "%Y-%m-%d").date()
+        latest = datetime.strptime(last['date'], "%Y-%m-%d").date()
+        pick_date = st.date_input("Pilih tarikh draw:", latest, min_value=first, max_value=latest, key="why_date")
+        explanation = explain_from_batch(get_insight_batch(), pick_date.isoformat())
+        if explanation:
+            st.markdown(f"**Nombor:** `{explanation['number']}` | {explanation['structure']}")
+            st.text(explanation['summary'])
+        else:
+            st.info(f"ℹ️ Tiada draw pada {pick_date.isoformat()}.")
+
+# ===================== VIEW RAMALAN =====================
+@st.fragment
+def render_ramalan(draws):
+    with view_timer("🧠 Ramalan"):
         st.markdown("### 🧠 Ramalan Base")
-        strat = st.selectbox("Pilih strategi base untuk ramalan:", ['frequency','gap','hybrid','qaisara','smartpattern'])
+        strat = st.selectbox("Pilih strategi base untuk ramalan:", STRATEGIES)
         recent_n = st.slider("Jumlah draw terkini digunakan untuk base:", 5, 120, 30, 5)
-        base = generate_base(draws, method=strat, recent_n=recent_n)
+        base = get_base(method=strat, recent_n=recent_n)
         for i,p in enumerate(base):
             st.text(f"Pick {i+1}: {' '.join(p)}")
-        preds = generate_predictions_from_base(base, max_preds=10)
+        preds = get_predictions(strat, recent_n, max_preds=10)
         st.markdown("**🔢 Ramalan Kombinasi 4D (Top 10):**")
         st.code('\n'.join(preds), language='text')
 
-    # ===================== TAB BACKTEST =====================
-    with tabs[2]:
+# ===================== VIEW BACKTEST =====================
+@st.fragment
+def render_backtest(draws):
+    with view_timer("🔁 Backtest"):
         st.markdown("### 🔁 Backtest Base")
         arah_pilihan = st.radio("🔁 Pilih arah bacaan digit:",
             ["Kiri ke Kanan (P1→P4)","Kanan ke Kiri (P4→P1)"], index=0, key="backtest_arah")
-        strat = st.selectbox("Pilih strategi base untuk backtest:", ['frequency','gap','hybrid','qaisara','smartpattern'])
+        strat = st.selectbox("Pilih strategi base untuk backtest:", STRATEGIES)
         base_n = st.slider("Jumlah draw terkini digunakan untuk jana base:", 5, 120, 30, 5)
         backtest_n = st.slider("Jumlah draw yang diuji (berapa kali backtest):", 5, 50, 10)
         if st.button("🚀 Jalankan Backtest"):
             run_backtest(draws, strategy=strat, recent_n=base_n, arah=arah_pilihan, backtest_rounds=backtest_n)
 
-    # ===================== TAB DRAW LIST =====================
-    with tabs[3]:
-        st.dataframe(pd.DataFrame(draws), use_container_width=True)
+# ===================== VIEW DRAW LIST =====================
+@st.fragment
+def render_draw_list(draws):
+    with view_timer("📋 Draw List"):
+        st.markdown("### 📋 Draw List")
+        first = datetime.strptime(draws[0]['date'], "%Y-%m-%d").date()
+        last = datetime.strptime(draws[-1]['date'], "%Y-%m-%d").date()
+        c1, c2 = st.columns(2)
+        date_range = c1.date_input("📅 Julat tarikh:", (first, last), min_value=first, max_value=last, key="dl_dates")
+        query = c2.text_input("🔎 Cari nombor / corak digit:", key="dl_query", help=QUERY_HELP)
+        start, end = (list(date_range) + [None, None])[:2]
 
-    # ===================== TAB WHEELPICK =====================
-    with tabs[4]:
+        try:
+            indices, stats = get_draw_query(
+                start.isoformat() if start else None,
+                end.isoformat() if end else None,
+                query
+            )
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            st.stop()
+
+        c1, c2, c3 = st.columns(3)
+        page_size = c1.selectbox("Baris setiap halaman:", [25, 50, 100, 200], index=1, key="dl_page_size")
+        pages = page_count(len(indices), page_size)
+        # Key ikut bilangan halaman supaya halaman kembali ke 1 bila tapisan berubah
+        page = c2.number_input(f"Halaman (1-{pages}):", 1, pages, 1, key=f"dl_page_{pages}")
+        c3.metric("Jumlah padanan", len(indices))
+
+        # Hanya halaman yang dipapar dihantar ke browser
+        st.dataframe(pd.DataFrame(page_rows(draws, indices, page, page_size), columns=['date', 'number']),
+                     use_container_width=True, hide_index=True)
+
+        with st.expander("📊 Statistik digit setiap posisi (draw yang ditapis)"):
+            st.dataframe(pd.DataFrame({f"P{i+1}": stats[i] for i in range(4)}),
+                         use_container_width=True)
+
+# ===================== VIEW WHEELPICK =====================
+@st.fragment
+def render_wheelpick(draws):
+    with view_timer("🎡 Wheelpick"):
         st.markdown("### 🎡 Wheelpick Generator")
         arah_pilihan_wp = st.radio("🔁 Pilih arah bacaan digit:",
             ["Kiri ke Kanan (P1→P4)","Kanan ke Kiri (P4→P1)"], index=0, key="wheelpick_arah")
-        like_sugg, dislike_sugg = get_like_dislike_digits(draws)
+        tracker = hotcold_tracker()
+        half_life = st.select_slider("⏳ Separuh hayat (draw) untuk cadangan:", tracker.half_lives,
+                                     value=30, key="wheelpick_half_life")
+        # Cadangan dari artifak harian jika sepadan; jika tidak dari tracker
+        like_sugg, dislike_sugg = (artifact_like_dislike(get_artifact(), draws, half_life)
+                                   or tracker.like_dislike(half_life))
         st.markdown(f"👍 **Cadangan LIKE:** `{like_sugg}`")
         st.markdown(f"👎 **Cadangan DISLIKE:** `{dislike_sugg}`")
+
+        with st.expander("🔥 Hot/Cold Setiap Posisi"):
+            rows = []
+            for p in range(4):
+                scores = tracker.scores(half_life, p)
+                trend = tracker.trend(position=p)
+                streaks = tracker.streaks(p)
+                for d in range(10):
+                    rows.append({
+                        "Posisi": f"P{p+1}", "Digit": str(d),
+                        "Skor": round(scores[d], 2), "Trend": trend[d],
+                        "Berturut": streaks[d][0], "Jarak": streaks[d][1],
+                    })
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
         user_like    = st.text_input("🟢 Masukkan digit LIKE (pisahkan ruang):", value=' '.join(like_sugg))
         user_dislike = st.text_input("🔴 Masukkan digit DISLIKE (pisahkan ruang):", value=' '.join(dislike_sugg))
         like_digits    = [d for d in user_like.strip().split()    if d.isdigit() and len(d)==1]
@@ -407,7 +392,8 @@ else:
                     st.stop()
                 manual_base.append(digs)
         else:
-            base = load_base_from_file()
+            entry = artifact_entry(get_artifact(), draws, 'frequency', 50)
+            base = entry['base'] if entry else get_base_from_file()
             if not base or len(base) != 4:
                 st.warning("⚠️ Base tidak sah. Sila klik 'Update Draw Terkini'.")
                 st.stop()
@@ -423,38 +409,16 @@ else:
             use_history = st.checkbox("❌ Buang nombor yang pernah naik")
             sim_limit   = st.slider("❌ Had maksimum persamaan digit dengan draw terakhir", 0, 4, 2)
 
-        def apply_filters(combos, draws, nr, nt, npair, na, uh, sl, likes, dislikes):
-            past = {d['number'] for d in draws}
-            last = draws[-1]['number'] if draws else "0000"
-            out = []
-            for e in combos:
-                num, e_lot = e.split("#####")
-                digs = list(num)
-                if nr and len(set(digs)) < 4: continue
-                if nt and any(digs.count(d) >= 3 for d in digs): continue
-                if npair and any(digs.count(d) == 2 for d in set(digs)): continue
-                if na and num in ["0123","1234","2345","3456","4567","5678","6789"]: continue
-                if uh and num in past: continue
-                sim = sum(1 for a, b in zip(num, last) if a == b)
-                if sim > sl: continue
-                if likes and not any(d in likes for d in digs): continue
-                if dislikes and any(d in dislikes for d in digs): continue
-                out.append(e)
-            return out
-
         combos = []
         if st.button("🎰 Create Wheelpick"):
-            for a in manual_base[0]:
-                for b in manual_base[1]:
-                    for c in manual_base[2]:
-                        for d in manual_base[3]:
-                            combos.append(f"{a}{b}{c}{d}#####{lot}")
+            combos = generate_wheel(manual_base, lot)
             st.info(f"💡 Sebelum tapis: {len(combos)} nombor")
             combos = apply_filters(
                 combos, draws,
                 no_repeat, no_triple, no_pair,
                 no_ascend, use_history, sim_limit,
-                like_digits, dislike_digits
+                like_digits, dislike_digits,
+                past=game_store().snapshot().number_set
             )
             st.success(f"✅ {len(combos)} nombor selepas ditapis.")
             part_size = 30
@@ -467,6 +431,64 @@ else:
             data = '\n'.join(combos).encode()
             st.download_button("💾 Muat Turun Semua Nombor", data=data,
                                file_name=filename, mime="text/plain")
+
+VIEWS = {
+    "📌 Insight": render_insight,
+    "🧠 Ramalan": render_ramalan,
+    "🔁 Backtest": render_backtest,
+    "📋 Draw List": render_draw_list,
+    "🎡 Wheelpick": render_wheelpick,
+}
+
+# ===================== UI =====================
+st.set_page_config(page_title="Breakcode4D Predictor", layout="wide")
+run_stats = perf.begin()
+show_perf = st.sidebar.checkbox("🐢 Panel prestasi (debug)", key="perf_panel")
+st.markdown(f"⏳ Next draw: `{str(get_draw_countdown_from_last_8pm()).split('.')[0]}`")
+if len(GAMES) > 1:
+    st.sidebar.selectbox("🎲 Game:", list(GAMES), format_func=lambda g: GAMES[g].label, key="game")
+st.title(f"🔮 Breakcode4D Predictor ({GAMES[current_game()].label})")
+
+col1, col2 = st.columns(2)
+with col1:
+    # Satu kerja update sahaja pada satu masa; pengguna lain yang klik (atau
+    # buka app semasa update berjalan) hanya menunggu kerja yang sama.
+    clicked = st.button("📥 Update Draw Terkini")
+    updater = get_updater(current_game())
+    job = updater.submit(current_game()) if clicked else updater.current()
+    if job is not None and (clicked or job.running):
+        bar = st.progress(0.0, text="⏳ Sedang update draw...")
+        while not job.wait(0.5):
+            bar.progress(job.fraction, text=f"⏳ Sedang update draw... {job.note} ({job.done}/{job.total})")
+        bar.empty()
+        if job.stats is not None:
+            perf.merge(job.stats)
+        clear_caches()
+        if job.error:
+            st.error(f"❌ Update gagal: {job.error}")
+        else:
+            st.success(job.result)
+            st.markdown("### 📋 Base Hari Ini")
+            st.code('\n'.join([' '.join(p) for p in get_base_from_file()]), language='text')
+with col2:
+    st.markdown("""
+    <a href="https://batman11.net/RegisterByReferral.aspx?MemberCode=BB1845" target="_blank">
+        <button style="width:100%;padding:0.6em;font-size:16px;background:#4CAF50;color:white;border:none;border-radius:5px;">
+            📝 Register Sini Batman 11 dan dapatkan BONUS!!!
+        </button>
+    </a>
+    """, unsafe_allow_html=True)
+
+draws = get_draws()
+if not draws:
+    st.warning("⚠️ Sila klik 'Update Draw Terkini' untuk mula. Proses ini hanya mengambil masa 1-5 minit sahaja.")
+else:
+    st.info(f"📅 Tarikh terakhir: **{draws[-1]['date']}** | 📊 Jumlah draw: **{len(draws)}**")
+    # Hanya paparan yang dipilih dijalankan; setiap paparan ialah fragment
+    # supaya widget di dalamnya hanya rerun paparan itu sahaja.
+    view = st.radio("Paparan:", list(VIEWS), horizontal=True, key="view", label_visibility="collapsed")
+    VIEWS[view](draws)
+
 # --- Link Hubungi Admin ---
 st.markdown("---")
 st.markdown("""
@@ -476,3 +498,7 @@ st.markdown("""
   </button>
 </a>
 """, unsafe_allow_html=True)
+
+perf.end(run_stats)
+if show_perf:
+    render_perf_panel(run_stats)
@@ -0,0 +1,150 @@
+# core/artifacts.py
+
+import json
+import os
+from datetime import datetime
+from core.hotcold import HALF_LIVES, HotColdTracker
+from core.perf import span
+from core.strategy import (STRATEGIES, NotEnoughDraws, UnknownStrategy, generate_base,
+                           generate_predictions_from_base)
+
+# Naikkan bila struktur fail berubah; artifak versi lain diabaikan (dijana semula)
+ARTIFACT_VERSION = 3
+# Nilai recent_n yang dijana awal (slider UI bergerak dalam gandaan 5/10)
+RECENT_NS = (10, 20, 30, 40, 50, 60, 80, 100)
+MAX_PREDS = 10
+# Bilangan snapshot (tarikh draw) disimpan setiap game; minimum 2 supaya
+# snapshot terkini dan 'as of semalam' (Insight) tidak pernah dibuang
+RETENTION = 30
+MIN_RETENTION = 2
+
+# ===================== BUILD =====================
+def build_artifact(draws, recent_ns=RECENT_NS, max_preds=MAX_PREDS):
+    """
+    Base dan ramalan untuk semua strategi x recent_n, serta like/dislike
+    hot/cold untuk setiap separuh hayat, dikira dari draws (snapshot 'as of'
+    tarikh draw terakhir).
+
+    Return:
+        dict - sedia untuk json; gabungan yang tidak cukup draw tiada dalam 'bases'.
+    """
+    bases = {}
+    for method in STRATEGIES:
+        entry = None
+        for n in recent_ns:
+            # smartpattern guna tetapan tetap setiap pick (abaikan recent_n): kira sekali
+            if entry is None or method != 'smartpattern':
+                try:
+                    base = generate_base(draws, method=method, recent_n=n)
+                except (NotEnoughDraws, UnknownStrategy):
+                    continue
+                entry = {
+                    'base': base,
+                    'predictions': generate_predictions_from_base(base, max_preds=max_preds),
+                }
+            bases.setdefault(method, {})[str(n)] = entry
+    # Sama seperti cadangan Wheelpick (HotColdTracker), bukan kiraan recent_n
+    tracker = HotColdTracker(d['number'] for d in draws)
+    like_dislike = {}
+    for h in HALF_LIVES:
+        like, dislike = tracker.like_dislike(h)
+        like_dislike[str(h)] = {'like': like, 'dislike': dislike}
+    last = draws[-1]
+    return {
+        'version': ARTIFACT_VERSION,
+        'as_of': last['date'],
+        'draws': len(draws),
+        'last_number': last['number'],
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'bases': bases,
+        'like_dislike': like_dislike,
+    }
+
+# ===================== STORAGE =====================
+def artifact_dir(game_dir='data'):
+    return os.path.join(game_dir, 'artifacts')
+
+def artifact_file(game_dir, as_of):
+    return os.path.join(artifact_dir(game_dir), f"{as_of}.json")
+
+def save_artifact(artifact, game_dir='data'):
+    file_path = artifact_file(game_dir, artifact['as_of'])
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    # Tulis ke fail sementara dan ganti sekaligus, supaya pembaca tidak nampak fail separuh
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(artifact, f, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
+    return file_path
+
+def load_artifact(file_path):
+    """Artifak dari fail; None jika tiada, rosak atau versi lain."""
+    try:
+        with open(file_path, 'r') as f:
+            artifact = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return artifact if artifact.get('version') == ARTIFACT_VERSION else None
+
+def artifact_dates(game_dir='data'):
+    """Tarikh semua snapshot yang disimpan, tersusun."""
+    folder = artifact_dir(game_dir)
+    if not os.path.isdir(folder):
+        return []
+    return sorted(name[:-5] for name in os.listdir(folder) if name.endswith('.json'))
+
+def prune_artifacts(game_dir='data', keep=RETENTION):
+    """
+    Buang snapshot paling lama, simpan 'keep' tarikh terkini (sekurang-kurangnya
+    MIN_RETENTION). Return tarikh yang dibuang.
+    """
+    removed = artifact_dates(game_dir)[:-max(keep, MIN_RETENTION)]
+    for as_of in removed:
+        os.remove(artifact_file(game_dir, as_of))
+    return removed
+
+# ===================== LOOKUP =====================
+def artifact_entry(artifact, draws, method, recent_n):
+    """
+    {'base', 'predictions'} untuk method/recent_n jika artifak sepadan
+    dengan draws (tarikh dan bilangan draw sama); None = kira sendiri.
+    """
+    if not artifact or not draws or not _matches(artifact, draws):
+        return None
+    return artifact['bases'].get(method, {}).get(str(recent_n))
+
+def artifact_like_dislike(artifact, draws, half_life=30):
+    """(like, dislike) hot/cold untuk half_life jika artifak sepadan dengan draws; None = kira sendiri."""
+    if not artifact or not draws or not _matches(artifact, draws):
+        return None
+    entry = artifact['like_dislike'].get(str(half_life))
+    return (entry['like'], entry['dislike']) if entry else None
+
+def _matches(artifact, draws):
+    last = draws[-1]
+    return (artifact['draws'] == len(draws) and artifact['as_of'] == last['date']
+            and artifact['last_number'] == last['number'])
+
+# ===================== MATERIALIZE =====================
+def materialize(draws, game_dir='data', keep=RETENTION, recent_ns=RECENT_NS, force=False):
+    """
+    Peringkat selepas update: simpan artifak untuk draw terkini dan untuk
+    draw sebelumnya ('as of semalam', digunakan Insight) jika belum ada atau
+    tidak sepadan (force=True jana semula), kemudian buang snapshot lama.
+
+    Return:
+        list[str] - tarikh artifak yang ditulis.
+    """
+    written = []
+    with span('materialize', draws=len(draws)):
+        for upto in (len(draws) - 1, len(draws)):
+            if upto < 1:
+                continue
+            snapshot = draws[:upto]
+            current = load_artifact(artifact_file(game_dir, snapshot[-1]['date']))
+            if not force and current and _matches(current, snapshot):
+                continue
+            save_artifact(build_artifact(snapshot, recent_ns), game_dir)
+            written.append(snapshot[-1]['date'])
+        prune_artifacts(game_dir, keep)
+    return written
@@ -0,0 +1,94 @@
+# core/backtest.py
+
+from core.crosspick import CrossPickEngine
+from core.markov import TransitionEngine
+from core.perf import span
+from core.strategy import NotEnoughDraws, UnknownStrategy, generate_base
+
+# Jumlah draw diperlukan mengikut strategi
+MIN_REQUIRED = {
+    'frequency': 50,
+    'gap': 120,
+    'hybrid': 50,
+    'qaisara': 60,
+    'smartai': 50,
+    'smartpattern': 60,  # paling besar antara semua pick
+    'crosspick': 51,
+    'markov': 51,
+    'markov_cross': 51
+}
+
+def match_insight(fp, base, arah='Kiri ke Kanan (P1→P4)'):
+    if arah == "Kanan ke Kiri (P4→P1)":
+        fp, base = fp[::-1], base[::-1]
+    return ["✅" if fp[i] in base[i] else "❌" for i in range(4)]
+
+def backtest(draws, strategy='hybrid', recent_n=50, arah='Kiri ke Kanan (P1→P4)', backtest_rounds=10):
+    """
+    Uji strategi ke atas backtest_rounds draw terakhir (setiap draw diuji
+    dengan base yang dijana dari draw sebelumnya sahaja).
+
+    Return:
+        list[dict] - satu baris setiap draw diuji ('Tarikh', 'Result 1st', 'Insight'),
+        terkini dahulu. NotEnoughDraws jika sejarah tidak cukup, UnknownStrategy
+        jika strategi tidak dilaksanakan.
+    """
+    with span('backtest', strategy=strategy, rounds=backtest_rounds):
+        return _backtest(draws, strategy, recent_n, arah, backtest_rounds)
+
+def _backtest(draws, strategy, recent_n, arah, backtest_rounds):
+    required = MIN_REQUIRED.get(strategy, 50)
+    if strategy in ('markov', 'markov_cross', 'crosspick'):
+        # Engine dibina sekali atas backtest_rounds + recent_n + 1 draw terakhir
+        required = max(required, recent_n + 1)
+    if len(draws) < backtest_rounds + required:
+        raise NotEnoughDraws(
+            f"❗ Tidak cukup draw untuk backtest '{strategy}'. "
+            f"Sekurang-kurangnya {backtest_rounds + required} draw diperlukan."
+        )
+
+    # Markov / crosspick: bina prefix sum sekali, kemudian base setiap pusingan ialah O(1)
+    engine = cross = None
+    window = draws[-(backtest_rounds + recent_n + 1):]
+    if strategy in ('markov', 'markov_cross'):
+        engine = TransitionEngine((d['number'] for d in window), cross=(strategy == 'markov_cross'))
+    elif strategy == 'crosspick':
+        cross = CrossPickEngine(d['number'] for d in window)
+
+    results = []
+    for i in range(backtest_rounds):
+        test_draw = draws[-(i+1)]
+        past_draws = draws[:-(i+1)]
+
+        try:
+            # Untuk strategi yang tak perlukan recent_n dihantar (urus sendiri)
+            if engine is not None:
+                base = engine.base(recent_n, stop=len(engine) - (i+1))
+            elif cross is not None:
+                # Sama seperti generate_base: anchor draw terakhir, tetingkap recent_n draw sebelumnya
+                stop = len(cross) - (i+1) - 1
+                base = cross.base(cross.numbers[stop], stop - recent_n, stop, top=5)
+            elif strategy in ['smartpattern']:
+                base = generate_base(past_draws, method=strategy)
+            else:
+                base = generate_base(past_draws, method=strategy, recent_n=recent_n)
+
+            insight = match_insight(test_draw['number'], base, arah)
+            results.append({
+                "Tarikh": test_draw['date'],
+                "Result 1st": test_draw['number'],
+                "Insight": ' '.join(f"P{j+1}:{s}" for j, s in enumerate(insight))
+            })
+        except (NotEnoughDraws, UnknownStrategy):
+            raise
+        except Exception as e:
+            results.append({
+                "Tarikh": test_draw['date'],
+                "Result 1st": test_draw['number'],
+                "Insight": f"⚠️ Ralat: {str(e)}"
+            })
+    return results
+
+def count_matched(results):
+    """Bilangan draw dengan sekurang-kurangnya satu digit match."""
+    return sum("✅" in r["Insight"] for r in results if "Insight" in r and isinstance(r["Insight"], str))
@@ -0,0 +1,247 @@
+# core/cli.py
+"""
+Antara muka baris arahan Breakcode4D (tanpa Streamlit).
+
+Contoh (dari root repo):
+    bin/breakcode4d update
+    bin/breakcode4d update --all-games --jobs 4
+    bin/breakcode4d base --method hybrid --recent-n 45
+    bin/breakcode4d backtest --strategy frequency markov --rounds 30 --format csv
+    bin/breakcode4d sweep --recent-n 20,30,50,80 --rounds 50 --jobs 4
+    bin/breakcode4d wheel --no-repeat --no-history --like "1 2" --dislike 9
+    bin/breakcode4d materialize --keep 60
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from core.artifacts import (MIN_RETENTION, RETENTION, artifact_dates, artifact_entry, artifact_file,
+                            load_artifact, materialize)
+from core.backtest import backtest, count_matched
+from core.games import DEFAULT_GAME, GAMES, game_file, ingest, update_games
+from core.jobs import file_lock
+from core.store import load_base_from_file, load_draws
+from core.strategy import STRATEGIES, NotEnoughDraws, UnknownStrategy, generate_base, generate_predictions_from_base
+from core.wheel import apply_filters, generate_wheel
+
+ARAH = {
+    'kiri': 'Kiri ke Kanan (P1→P4)',
+    'kanan': 'Kanan ke Kiri (P4→P1)',
+}
+# 'gap' belum dilaksanakan
+DEFAULT_STRATEGIES = [s for s in STRATEGIES if s != 'gap']
+
+# ===================== OUTPUT =====================
+def emit(rows, fmt='json', out=None):
+    out = out or sys.stdout
+    if fmt == 'csv':
+        fields = []
+        for row in rows:
+            fields += [k for k in row if k not in fields]
+        writer = csv.DictWriter(out, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump(rows, out, ensure_ascii=False, indent=2)
+        out.write('\n')
+
+def parallel_map(fn, items, jobs=1):
+    """Jalankan fn ke atas setiap item; jobs > 1 guna proses berasingan."""
+    if jobs > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(fn, items))
+    return [fn(item) for item in items]
+
+def cut_draws(draws, before=None):
+    """Draw sebelum tarikh 'before' (YYYY-MM-DD), atau semua."""
+    return [d for d in draws if d['date'] < before] if before else draws
+
+def data_dir_of(args):
+    # Artifak disimpan bersebelahan fail draw (sama seperti base.txt)
+    return os.path.dirname(args.data) or '.'
+
+def base_for(args, draws, method, recent_n):
+    """Base dari artifak harian jika ada dan sepadan; jika tidak (atau --fresh) kira semula."""
+    if draws and not args.fresh:
+        artifact = load_artifact(artifact_file(data_dir_of(args), draws[-1]['date']))
+        entry = artifact_entry(artifact, draws, method, recent_n)
+        if entry:
+            return entry['base']
+    return generate_base(draws, method, recent_n)
+
+# ===================== WORKERS =====================
+def _backtest_job(task):
+    draws, strategy, recent_n, arah, rounds = task
+    try:
+        results = backtest(draws, strategy, recent_n, arah, rounds)
+    except (NotEnoughDraws, UnknownStrategy) as e:
+        return {'strategy': strategy, 'recent_n': recent_n, 'error': str(e), 'results': []}
+    return {'strategy': strategy, 'recent_n': recent_n, 'results': results}
+
+def _position_hits(results):
+    hits = [0, 0, 0, 0]
+    for r in results:
+        for part in r['Insight'].split():
+            if part[:1] == 'P' and part.endswith('✅'):
+                hits[int(part[1]) - 1] += 1
+    return hits
+
+# ===================== COMMANDS =====================
+def cmd_update(args):
+    if args.all_games:
+        if args.data_given:
+            raise ValueError("--data tidak boleh digabung dengan --all-games (guna --data-dir).")
+        results = update_games(data_dir=args.data_dir, max_days_back=args.max_days_back, jobs=args.jobs)
+        return [{'game': g, 'message': msg, 'draws': len(load_draws(game_file(g, data_dir=args.data_dir)))}
+                for g, msg in results.items()]
+    with file_lock(args.lock or os.path.join(data_dir_of(args), '.update.lock')):
+        msg = ingest(args.game, args.data_dir, args.max_days_back, file_path=args.data)
+    return [{'game': args.game, 'message': msg, 'draws': len(load_draws(args.data))}]
+
+def cmd_base(args):
+    draws = cut_draws(load_draws(args.data), args.before)
+    base = base_for(args, draws, args.method, args.recent_n)
+    rows = [{'pick': f"P{i+1}", 'digits': ' '.join(p)} for i, p in enumerate(base)]
+    if args.predictions:
+        rows += [{'pick': 'prediction', 'digits': p}
+                 for p in generate_predictions_from_base(base, max_preds=args.predictions)]
+    return rows
+
+def cmd_backtest(args):
+    draws = load_draws(args.data)
+    tasks = [(draws, s, args.recent_n, ARAH[args.arah], args.rounds) for s in args.strategy]
+    rows = []
+    for res in parallel_map(_backtest_job, tasks, args.jobs):
+        if 'error' in res:
+            rows.append({'strategy': res['strategy'], 'error': res['error']})
+            continue
+        if args.summary:
+            rows.append({'strategy': res['strategy'], 'recent_n': res['recent_n'], 'rounds': args.rounds,
+                         'matched': count_matched(res['results'])})
+        else:
+            rows += [{'strategy': res['strategy'], **r} for r in res['results']]
+    return rows
+
+def cmd_sweep(args):
+    draws = load_draws(args.data)
+    windows = [int(n) for n in args.recent_n.split(',')]
+    tasks = [(draws, s, n, ARAH[args.arah], args.rounds) for s in args.strategy for n in windows]
+    rows = []
+    for res in parallel_map(_backtest_job, tasks, args.jobs):
+        row = {'strategy': res['strategy'], 'recent_n': res['recent_n'], 'rounds': args.rounds}
+        if 'error' in res:
+            row['error'] = res['error']
+        else:
+            hits = _position_hits(res['results'])
+            row.update({'matched': count_matched(res['results']),
+                        **{f"P{i+1}_hits": h for i, h in enumerate(hits)}})
+        rows.append(row)
+    return sorted(rows, key=lambda r: -r.get('matched', -1))
+
+def cmd_wheel(args):
+    draws = load_draws(args.data)
+    if args.method:
+        base = base_for(args, draws, args.method, args.recent_n)
+    else:
+        base_file = args.base_file or game_file(args.game, 'base.txt', args.data_dir)
+        base = load_base_from_file(base_file)
+        if not base or len(base) != 4:
+            raise ValueError(f"Base tidak sah dalam {base_file}. Jalankan 'update' dahulu.")
+    combos = apply_filters(
+        generate_wheel(base, args.lot), draws,
+        args.no_repeat, args.no_triple, args.no_pair,
+        args.no_ascend, args.no_history, args.sim_limit,
+        args.like.split(), args.dislike.split()
+    )
+    return [dict(zip(('number', 'lot'), e.split('#####'))) for e in combos]
+
+def cmd_materialize(args):
+    if args.keep < MIN_RETENTION:
+        raise ValueError(f"--keep mesti sekurang-kurangnya {MIN_RETENTION} (snapshot terkini dan semalam).")
+    written = materialize(load_draws(args.data), data_dir_of(args), keep=args.keep, force=args.force)
+    return [{'as_of': d, 'written': d in written} for d in artifact_dates(data_dir_of(args))]
+
+# ===================== PARSER =====================
+def build_parser():
+    parser = argparse.ArgumentParser(prog='breakcode4d', description="Breakcode4D tanpa Streamlit")
+    parser.add_argument('--game', choices=list(GAMES), default=DEFAULT_GAME)
+    parser.add_argument('--data-dir', default='data', help="folder data (setiap game dalam partition sendiri)")
+    parser.add_argument('--data', help="fail draw (default ikut --game)")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json')
+    parser.add_argument('--output', help="tulis ke fail (default stdout)")
+    parser.add_argument('--fresh', action='store_true', help="abaikan artifak harian, kira semula base")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('update', help="ambil draw baru dan jana base.txt / base_last.txt")
+    p.add_argument('--max-days-back', type=int, default=181)
+    p.add_argument('--lock', help="fail kunci (default ikut game, dikongsi dengan app)")
+    p.add_argument('--all-games', action='store_true', help="update semua game secara selari")
+    p.add_argument('--jobs', type=int, help="bilangan game diupdate serentak (default semua)")
+    p.set_defaults(func=cmd_update)
+
+    p = sub.add_parser('base', help="jana base untuk satu strategi")
+    p.add_argument('--method', choices=STRATEGIES, default='frequency')
+    p.add_argument('--recent-n', type=int, default=50)
+    p.add_argument('--before', help="guna draw sebelum tarikh ini sahaja (YYYY-MM-DD)")
+    p.add_argument('--predictions', type=int, default=0, help="tambah N ramalan kombinasi")
+    p.set_defaults(func=cmd_base)
+
+    p = sub.add_parser('backtest', help="backtest satu atau lebih strategi")
+    p.add_argument('--strategy', nargs='+', choices=DEFAULT_STRATEGIES, default=DEFAULT_STRATEGIES)
+    p.add_argument('--recent-n', type=int, default=50)
+    p.add_argument('--rounds', type=int, default=10)
+    p.add_argument('--arah', choices=list(ARAH), default='kiri')
+    p.add_argument('--summary', action='store_true', help="satu baris ringkasan setiap strategi")
+    p.add_argument('--jobs', type=int, default=1, help="bilangan proses selari")
+    p.set_defaults(func=cmd_backtest)
+
+    p = sub.add_parser('sweep', help="backtest semua gabungan strategi x recent_n")
+    p.add_argument('--strategy', nargs='+', choices=DEFAULT_STRATEGIES, default=DEFAULT_STRATEGIES)
+    p.add_argument('--recent-n', default='20,30,40,50,60,80,100', help="senarai dipisah koma")
+    p.add_argument('--rounds', type=int, default=30)
+    p.add_argument('--arah', choices=list(ARAH), default='kiri')
+    p.add_argument('--jobs', type=int, default=1, help="bilangan proses selari")
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser('wheel', help="jana dan tapis wheelpick")
+    p.add_argument('--base-file', help="default base.txt dalam folder game")
+    p.add_argument('--method', choices=STRATEGIES, help="jana base dengan strategi ini (bukan dari fail)")
+    p.add_argument('--recent-n', type=int, default=50)
+    p.add_argument('--lot', default='0.10')
+    p.add_argument('--no-repeat', action='store_true', help="buang nombor dengan digit berulang")
+    p.add_argument('--no-triple', action='store_true', help="buang nombor triple")
+    p.add_argument('--no-pair', action='store_true', help="buang nombor pair")
+    p.add_argument('--no-ascend', action='store_true', help="buang nombor menaik")
+    p.add_argument('--no-history', action='store_true', help="buang nombor yang pernah naik")
+    p.add_argument('--sim-limit', type=int, default=2, help="had persamaan digit dengan draw terakhir")
+    p.add_argument('--like', default='', help="digit LIKE, pisahkan ruang")
+    p.add_argument('--dislike', default='', help="digit DISLIKE, pisahkan ruang")
+    p.set_defaults(func=cmd_wheel)
+
+    p = sub.add_parser('materialize', help="jana artifak harian (base, ramalan, like/dislike) dan buang yang lama")
+    p.add_argument('--keep', type=int, default=RETENTION, help=f"bilangan snapshot disimpan, minimum {MIN_RETENTION} (default {RETENTION})")
+    p.add_argument('--force', action='store_true', help="jana semula walaupun artifak sudah sepadan")
+    p.set_defaults(func=cmd_materialize)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.data_given = args.data is not None
+    args.data = args.data or game_file(args.game, data_dir=args.data_dir)
+    try:
+        rows = args.func(args)
+    except (NotEnoughDraws, UnknownStrategy, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            emit(rows, args.format, f)
+    else:
+        emit(rows, args.format)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
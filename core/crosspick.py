@@ -0,0 +1,133 @@
+# core/crosspick.py
+
+import threading
+from array import array
+
+# Tensor penuh C[i][j][a][b] (4x4x10x10) = bilangan draw dengan digit a di
+# posisi i DAN digit b di posisi j. Oleh kerana C[j][i] = transpose C[i][j],
+# hanya 6 pasangan i<j (600 sel) + pepenjuru i==j (40 sel) disimpan.
+PAIRS = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+PAIR_INDEX = {p: k for k, p in enumerate(PAIRS)}
+DIAG_OFFSET = len(PAIRS) * 100
+CELLS = DIAG_OFFSET + 40
+
+def _cell(i, a, j, b):
+    if i == j:
+        return DIAG_OFFSET + i * 10 + a if a == b else None
+    if i > j:
+        i, a, j, b = j, b, i, a
+    return PAIR_INDEX[(i, j)] * 100 + a * 10 + b
+
+class CrossPickEngine:
+    """
+    Kiraan co-occurrence silang posisi, dikemas kini secara incremental.
+
+    Setiap draw yang ditambah menyimpan satu baris prefix sum (CELLS integer),
+    jadi kiraan untuk mana-mana tetingkap [start, stop) ialah
+    prefix[stop] - prefix[start], iaitu O(1) tanpa imbas semula sejarah.
+    """
+
+    def __init__(self, numbers=()):
+        self._prefix = array('I', [0] * CELLS)
+        self.numbers = []
+        self._lock = threading.Lock()
+        self.extend(numbers)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def append(self, number):
+        row = self._prefix[-CELLS:]
+        digits = [int(d) for d in number]
+        for k, (i, j) in enumerate(PAIRS):
+            row[k * 100 + digits[i] * 10 + digits[j]] += 1
+        for i in range(4):
+            row[DIAG_OFFSET + i * 10 + digits[i]] += 1
+        self._prefix.extend(row)
+        self.numbers.append(number)
+
+    def extend(self, numbers):
+        for number in numbers:
+            self.append(number)
+
+    def sync(self, numbers):
+        """
+        Selaraskan engine dengan sejarah terkini (selamat untuk banyak sesi).
+        Jika sejarah hanya bertambah, hanya draw baru ditambah; jika tidak, bina semula.
+        """
+        with self._lock:
+            n = len(self.numbers)
+            if n > len(numbers) or (n and self.numbers[-1] != numbers[n - 1]):
+                self._prefix = array('I', [0] * CELLS)
+                self.numbers = []
+                n = 0
+            self.extend(numbers[n:])
+        return self
+
+    def _window(self, start, stop):
+        stop = len(self) if stop is None else stop
+        return max(0, start or 0) * CELLS, stop * CELLS
+
+    def count(self, i, a, j, b, start=None, stop=None):
+        """Bilangan draw dalam [start, stop) dengan digit a di posisi i dan digit b di posisi j."""
+        cell = _cell(i, a, j, b)
+        if cell is None:
+            return 0
+        lo, hi = self._window(start, stop)
+        return self._prefix[hi + cell] - self._prefix[lo + cell]
+
+    def tensor(self, start=None, stop=None):
+        """Tensor penuh 4x4x10x10 untuk tetingkap [start, stop)."""
+        return [[[[self.count(i, a, j, b, start, stop) for b in range(10)]
+                  for a in range(10)] for j in range(4)] for i in range(4)]
+
+    def given(self, i, d, start=None, stop=None):
+        """
+        Kiraan digit di posisi lain bila digit d muncul di posisi i.
+
+        Return:
+            dict {j: [kiraan digit 0-9]} untuk setiap j != i.
+        """
+        lo, hi = self._window(start, stop)
+        prefix = self._prefix
+        out = {}
+        for j in range(4):
+            if j == i:
+                continue
+            cells = [_cell(i, d, j, b) for b in range(10)]
+            out[j] = [prefix[hi + c] - prefix[lo + c] for c in cells]
+        return out
+
+    def cross_pick_data(self, anchor, start=None, stop=None, top=3):
+        """
+        Digit kerap setiap pick berdasarkan digit anchor (biasanya draw sebelum)
+        di posisi lain, dalam format cross_pick_data untuk ai_insight_explainer.
+
+        Return:
+            dict {'Pick k': [(digit, kiraan), ...]} disusun menurun.
+        """
+        scores = [[0] * 10 for _ in range(4)]
+        for i, d in enumerate(anchor):
+            for j, counts in self.given(i, int(d), start, stop).items():
+                for b, c in enumerate(counts):
+                    scores[j][b] += c
+        data = {}
+        for j in range(4):
+            ranked = sorted(range(10), key=lambda b: (-scores[j][b], b))
+            data[f'Pick {j+1}'] = [(str(b), scores[j][b]) for b in ranked[:top] if scores[j][b]]
+        return data
+
+    def base(self, anchor, start=None, stop=None, top=5):
+        """
+        Base strategi crosspick: top digit setiap pick dari cross_pick_data.
+        Digit tanpa kiraan dibuang oleh cross_pick_data, jadi senarai dilengkapkan
+        dengan digit selebihnya (menaik, sama seperti susunan seri) supaya
+        setiap pick sentiasa ada 'top' digit.
+        """
+        data = self.cross_pick_data(anchor, start, stop, top)
+        result = []
+        for j in range(4):
+            digits = [d for d, _ in data[f'Pick {j+1}']]
+            digits += [str(b) for b in range(10) if str(b) not in digits][:top - len(digits)]
+            result.append(digits)
+        return result
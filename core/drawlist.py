@@ -0,0 +1,88 @@
+# core/drawlist.py
+
+import re
+from bisect import bisect_left, bisect_right
+
+QUERY_HELP = (
+    "Pisahkan syarat dengan koma (semua mesti lulus). Contoh: "
+    "`1234` (tepat), `12**` (wildcard), `7` (ada digit 7), "
+    "`3 in P2` atau `P2=3`, `perm 1234` (semua susunan 1234)"
+)
+
+def _clause(text):
+    """Tukar satu syarat carian kepada fungsi predicate(number) -> bool."""
+    t = text.strip().lower()
+
+    m = (re.fullmatch(r"(?P<d>\d)\s*in\s*p(?P<p>[1-4])", t)
+         or re.fullmatch(r"p(?P<p>[1-4])\s*=\s*(?P<d>\d)", t))
+    if m:
+        pos, digit = int(m.group('p')) - 1, m.group('d')
+        return lambda n: n[pos] == digit
+
+    m = re.fullmatch(r"(?:perm|box)\s*(\d{4})", t)
+    if m:
+        key = ''.join(sorted(m.group(1)))
+        return lambda n: ''.join(sorted(n)) == key
+
+    if re.fullmatch(r"\d", t):
+        return lambda n: t in n
+
+    if re.fullmatch(r"[\d*?]{4}", t):
+        pattern = [(i, c) for i, c in enumerate(t) if c.isdigit()]
+        return lambda n: all(n[i] == c for i, c in pattern)
+
+    raise ValueError(f"Syarat carian tidak difahami: `{text.strip()}`")
+
+def parse_query(text):
+    """
+    Parse teks carian kepada senarai predicate.
+
+    Params:
+        text: str - contoh '3 in P2, perm 1234'
+
+    Return:
+        list[callable] - kosong jika tiada syarat.
+    """
+    return [_clause(part) for part in (text or '').split(',') if part.strip()]
+
+def query_draws(draws, start=None, end=None, query='', dates=None):
+    """
+    Tapis draw ikut julat tarikh dan syarat nombor.
+
+    Params:
+        draws: list[dict] - draw tersusun ikut tarikh (format {'date', 'number'})
+        start, end: str | None - tarikh 'YYYY-MM-DD' (inklusif)
+        query: str - lihat QUERY_HELP
+        dates: tuple | None - senarai tarikh pra-kira (contoh DrawSnapshot.dates)
+
+    Return:
+        list[int] - indeks draw yang lulus, terkini dahulu.
+    """
+    if dates is None:
+        dates = [d['date'] for d in draws]
+    lo = bisect_left(dates, start) if start else 0
+    hi = bisect_right(dates, end) if end else len(draws)
+    predicates = parse_query(query)
+    return [i for i in range(hi - 1, lo - 1, -1)
+            if all(p(draws[i]['number']) for p in predicates)]
+
+def page_rows(draws, indices, page=1, page_size=50):
+    """Pulangkan hanya baris untuk satu halaman (page bermula dari 1)."""
+    start = (page - 1) * page_size
+    return [draws[i] for i in indices[start:start + page_size]]
+
+def page_count(total, page_size=50):
+    return max(1, (total + page_size - 1) // page_size)
+
+def position_stats(draws, indices):
+    """
+    Kira kekerapan digit 0-9 bagi setiap posisi untuk draw yang ditapis.
+
+    Return:
+        list[list[int]] - 4 senarai (P1-P4), setiap satu 10 kiraan.
+    """
+    counts = [[0] * 10 for _ in range(4)]
+    for i in indices:
+        for pos, d in enumerate(draws[i]['number']):
+            counts[pos][int(d)] += 1
+    return counts
@@ -0,0 +1,94 @@
+# core/games.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from core.artifacts import materialize
+from core.jobs import file_lock
+from core.store import load_draws
+
+DEFAULT_GAME = 'gdlotto'
+
+class ResultSource:
+    """
+    Sumber result satu game/operator.
+
+    Params:
+        name: str - kunci game (juga nama folder data/<name>/)
+        label: str - nama untuk paparan
+        url_template: str - URL result dengan placeholder {date} (YYYY-MM-DD)
+        extract: callable | None - extract(html) -> nombor 1st prize (str 4 digit) atau None;
+                 None = span id="1stPz" (format gdlotto)
+    """
+
+    def __init__(self, name, label, url_template, extract=None):
+        self.name = name
+        self.label = label
+        self.url_template = url_template
+        self.extract = extract
+
+    def __repr__(self):
+        return f"ResultSource({self.name!r})"
+
+def span_extractor(span_id):
+    """Extractor untuk halaman yang letak 1st prize dalam <span id=span_id>."""
+    def extract(html):
+        from core.update import extract_1st_prize
+        return extract_1st_prize(html, span_id)
+    return extract
+
+GAMES = {}
+
+def register_game(source):
+    GAMES[source.name] = source
+    return source
+
+register_game(ResultSource(
+    'gdlotto', 'GD Lotto',
+    "https://gdlotto.net/results/ajax/_result.aspx?past=1&d={date}",
+))
+
+# ===================== STORAGE =====================
+def game_dir(game=DEFAULT_GAME, data_dir='data'):
+    # Game asal kekal terus dalam data/ (serasi dengan fail sedia ada); game lain dalam data/<game>/
+    return data_dir if game == DEFAULT_GAME else os.path.join(data_dir, game)
+
+def game_file(game=DEFAULT_GAME, name='draws.txt', data_dir='data'):
+    return os.path.join(game_dir(game, data_dir), name)
+
+# ===================== INGESTION =====================
+def ingest(game=DEFAULT_GAME, data_dir='data', max_days_back=181, progress=None, file_path=None):
+    """
+    Update draw satu game, kemudian jana artifak harian (tanpa kunci;
+    pemanggil urus file_lock / SingleFlight). file_path ganti fail draw
+    default game; base dan artifak ditulis bersebelahan fail itu.
+    """
+    from core.update import update_draws
+    source = GAMES[game]
+    file_path = file_path or game_file(game, data_dir=data_dir)
+    msg = update_draws(file_path, max_days_back, progress,
+                       url_template=source.url_template, extract=source.extract)
+    materialize(load_draws(file_path), os.path.dirname(file_path) or '.')
+    return msg
+
+def update_game(game=DEFAULT_GAME, data_dir='data', max_days_back=181):
+    with file_lock(game_file(game, '.update.lock', data_dir)):
+        return ingest(game, data_dir, max_days_back)
+
+def update_games(games=None, data_dir='data', max_days_back=181, jobs=None):
+    """
+    Update beberapa game serentak (satu thread setiap game, setiap satu di
+    bawah kunci fail sendiri).
+
+    Return:
+        dict {game: mesej} - mesej ralat jika game itu gagal.
+    """
+    games = list(games or GAMES)
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs or len(games) or 1) as pool:
+        futures = {g: pool.submit(update_game, g, data_dir, max_days_back) for g in games}
+        for game, future in futures.items():
+            try:
+                results[game] = future.result()
+            except Exception as e:
+                results[game] = f"❌ {e}"
+    return results
@@ -0,0 +1,116 @@
+# core/hotcold.py
+
+import threading
+
+HALF_LIVES = (10, 30, 90)
+
+class HotColdTracker:
+    """
+    Penjejak digit hot/cold dengan kiraan berkurang secara eksponen (decay).
+
+    Untuk setiap separuh hayat h, skor = jumlah 0.5 ** (umur / h) bagi setiap
+    kemunculan digit, disimpan per posisi (P1-P4) dan keseluruhan. Setiap draw
+    baru hanya mengemas kini 50 skor per h (O(1)), tanpa imbas semula sejarah.
+    """
+
+    def __init__(self, numbers=(), half_lives=HALF_LIVES):
+        self.half_lives = tuple(sorted(half_lives))
+        self._lock = threading.Lock()
+        self._reset()
+        self.extend(numbers)
+
+    def _reset(self):
+        self.numbers = []
+        self._decay = {h: 0.5 ** (1 / h) for h in self.half_lives}
+        self._pos = {h: [[0.0] * 10 for _ in range(4)] for h in self.half_lives}
+        self._all = {h: [0.0] * 10 for h in self.half_lives}
+        self._last_seen = [[None] * 10 for _ in range(4)]   # indeks draw terakhir digit muncul
+        self._run = [[0] * 10 for _ in range(4)]            # berapa draw berturut-turut muncul
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def append(self, number):
+        t = len(self.numbers)
+        for h, f in self._decay.items():
+            pos, overall = self._pos[h], self._all[h]
+            for p in range(4):
+                row = pos[p]
+                for d in range(10):
+                    row[d] *= f
+            for d in range(10):
+                overall[d] *= f
+            for p, ch in enumerate(number):
+                pos[p][int(ch)] += 1
+                overall[int(ch)] += 1
+        for p, ch in enumerate(number):
+            d = int(ch)
+            self._run[p][d] = self._run[p][d] + 1 if self._last_seen[p][d] == t - 1 else 1
+            self._last_seen[p][d] = t
+        self.numbers.append(number)
+
+    def extend(self, numbers):
+        for number in numbers:
+            self.append(number)
+
+    def sync(self, numbers):
+        """Selaraskan dengan sejarah terkini; hanya draw baru ditambah jika sejarah bertambah."""
+        with self._lock:
+            n = len(self.numbers)
+            if n > len(numbers) or (n and self.numbers[-1] != numbers[n - 1]):
+                self._reset()
+                n = 0
+            self.extend(numbers[n:])
+        return self
+
+    def _check(self, half_life):
+        if half_life not in self._decay:
+            raise ValueError(f"Separuh hayat {half_life} tidak dijejak (pilih {self.half_lives})")
+
+    def scores(self, half_life=30, position=None):
+        """Skor decayed digit 0-9; position None = keseluruhan, 0-3 = P1-P4."""
+        self._check(half_life)
+        return list(self._all[half_life] if position is None else self._pos[half_life][position])
+
+    def like_dislike(self, half_life=30, position=None, k=3):
+        s = self.scores(half_life, position)
+        ranked = sorted(range(10), key=lambda d: (-s[d], d))
+        return [str(d) for d in ranked[:k]], [str(d) for d in ranked[-k:]]
+
+    def trend(self, short=None, long=None, position=None, tolerance=0.15):
+        """
+        Bandingkan kadar kemunculan separuh hayat pendek vs panjang.
+
+        Return:
+            list 10 nilai: 'naik', 'turun' atau 'stabil' untuk digit 0-9.
+        """
+        short = short or self.half_lives[0]
+        long = long or self.half_lives[-1]
+        s_short, s_long = self.scores(short, position), self.scores(long, position)
+        # Skor * (1 - f) ialah anggaran kadar per draw untuk separuh hayat itu
+        r_short = [v * (1 - self._decay[short]) for v in s_short]
+        r_long = [v * (1 - self._decay[long]) for v in s_long]
+        out = []
+        for a, b in zip(r_short, r_long):
+            if a > b * (1 + tolerance):
+                out.append('naik')
+            elif a < b * (1 - tolerance):
+                out.append('turun')
+            else:
+                out.append('stabil')
+        return out
+
+    def streaks(self, position):
+        """
+        Return:
+            list 10 tuple (berturut, jarak) untuk digit 0-9 di posisi itu:
+            berturut = bilangan draw berturut-turut terkini digit muncul (0 jika tiada
+            dalam draw terakhir), jarak = draw sejak kali terakhir muncul (None jika belum).
+        """
+        t = len(self.numbers) - 1
+        out = []
+        for d in range(10):
+            last = self._last_seen[position][d]
+            run = self._run[position][d] if last == t else 0
+            out.append((run, None if last is None else t - last))
+        return out
@@ -1,6 +1,7 @@
 # core/insight.py
 
-from collections import Counter
+from bisect import bisect_left
+from collections import Counter, deque
 
 def ai_insight_explainer(result_number, base_digits, cross_pick_data, recent_draws):
     """
@@ -34,24 +35,145 @@ def ai_insight_explainer(result_number, base_digits, cross_pick_data, recent_dra
         explanation['digits'].append(digit_info)
 
     # Struktur kombinasi
+    explanation['structure'] = _structure(result_number)
+
+    # Rumusan akhir
+    explanation['summary'] = _summary(explanation['digits'])
+    return explanation
+
+def _structure(result_number):
     even_count = sum(1 for d in result_number if int(d) % 2 == 0)
     odd_count = 4 - even_count
     repeat_digits = [item for item, count in Counter(result_number).items() if count > 1]
-
-    explanation['structure'] = f"{odd_count} Ganjil / {even_count} Genap. " + \
+    return f"{odd_count} Ganjil / {even_count} Genap. " + \
         ("Ada ulangan digit: " + ", ".join(repeat_digits) if repeat_digits else "Tiada ulangan digit.")
 
-    # Rumusan akhir
+def _summary(digits, window=30):
     reasons = []
-    for info in explanation['digits']:
+    for info in digits:
         reason = f"• {info['digit']} dalam {info['pick']}: "
         if info['in_base']:
             reason += "✅ Ada dalam base. "
         if info['in_cross']:
             reason += "🔥 Muncul dalam cross-pick. "
         if info['recent_hits'] >= 3:
-            reason += f"📈 Muncul {info['recent_hits']} kali dalam 30 draw terakhir."
+            reason += f"📈 Muncul {info['recent_hits']} kali dalam {window} draw terakhir."
         reasons.append(reason)
+    return "\n".join(reasons)
 
-    explanation['summary'] = "\n".join(reasons)
-    return explanation
+# ===================== BATCH MODE =====================
+def rolling_presence(numbers):
+    """
+    Prefix sum kehadiran digit: prefix[d][i] = bilangan draw dalam numbers[:i]
+    yang mengandungi digit d. recent_hits untuk mana-mana tetingkap ialah
+    prefix[d][i] - prefix[d][i - window], iaitu O(1).
+    """
+    prefix = [[0] * (len(numbers) + 1) for _ in range(10)]
+    for i, number in enumerate(numbers):
+        present = set(number)
+        for d in range(10):
+            prefix[d][i + 1] = prefix[d][i] + (str(d) in present)
+    return prefix
+
+def rolling_frequency_bases(numbers, recent_n=50, top=5):
+    """
+    Base strategi 'frequency' sebelum setiap draw, dikira secara rolling.
+
+    bases[i] sama dengan generate_base(draws[:i], 'frequency', recent_n)
+    (termasuk susunan seri ikut kemunculan pertama dalam tetingkap);
+    None jika i < recent_n.
+    """
+    counts = [[0] * 10 for _ in range(4)]
+    seen = [[deque() for _ in range(10)] for _ in range(4)]  # indeks kemunculan dalam tetingkap
+    bases = []
+    for i, number in enumerate(numbers):
+        if i >= recent_n:
+            bases.append([
+                [str(d) for d in sorted(
+                    (d for d in range(10) if counts[p][d]),
+                    key=lambda d: (-counts[p][d], seen[p][d][0])
+                )[:top]]
+                for p in range(4)
+            ])
+            old = numbers[i - recent_n]
+            for p in range(4):
+                d = int(old[p])
+                counts[p][d] -= 1
+                seen[p][d].popleft()
+        else:
+            bases.append(None)
+        for p in range(4):
+            d = int(number[p])
+            counts[p][d] += 1
+            seen[p][d].append(i)
+    return bases
+
+def ai_insight_batch(draws, bases=None, cross_pick=None, window=30):
+    """
+    Terangkan semua draw dalam sejarah sekali jalan (format kolum).
+
+    Params:
+        draws: list[dict] - sejarah draw (format {'date', 'number'})
+        bases: list | None - bases[i] = base 4 pick sebelum draw i
+               (default: rolling_frequency_bases dengan recent_n=50)
+        cross_pick: callable | None - cross_pick(i) pulangkan cross_pick_data
+               (format sama seperti ai_insight_explainer) sebelum draw i
+        window: int - bilangan draw terkini untuk recent_hits
+
+    Return:
+        dict kolum: 'date', 'number', 'odd', 'even', 'repeat', dan untuk
+        setiap pick k=1..4: 'in_base_k', 'in_cross_k', 'recent_hits_k'.
+    """
+    numbers = [d['number'] for d in draws]
+    if bases is None:
+        bases = rolling_frequency_bases(numbers)
+    prefix = rolling_presence(numbers)
+
+    batch = {
+        'date': [d['date'] for d in draws],
+        'number': numbers,
+        'odd': [], 'even': [], 'repeat': [],
+    }
+    for k in range(1, 5):
+        batch[f'in_base_{k}'] = []
+        batch[f'in_cross_{k}'] = []
+        batch[f'recent_hits_{k}'] = []
+
+    for i, number in enumerate(numbers):
+        even = sum(1 for d in number if int(d) % 2 == 0)
+        batch['odd'].append(4 - even)
+        batch['even'].append(even)
+        batch['repeat'].append(''.join(d for d, c in Counter(number).items() if c > 1))
+
+        base = bases[i] or [[] for _ in range(4)]
+        cross = cross_pick(i) if cross_pick else {}
+        lo = max(0, i - window)
+        for k, digit in enumerate(number, start=1):
+            batch[f'in_base_{k}'].append(digit in base[k - 1])
+            batch[f'in_cross_{k}'].append(digit in [d for d, _ in cross.get(f'Pick {k}', [])])
+            batch[f'recent_hits_{k}'].append(prefix[int(digit)][i] - prefix[int(digit)][lo])
+    return batch
+
+def explain_from_batch(batch, date, window=30):
+    """
+    Pulangkan penjelasan (format sama seperti ai_insight_explainer) untuk
+    draw pada tarikh tertentu, terus dari hasil ai_insight_batch.
+    None jika tarikh tiada.
+    """
+    i = bisect_left(batch['date'], date)
+    if i == len(batch['date']) or batch['date'][i] != date:
+        return None
+    number = batch['number'][i]
+    digits = [{
+        'digit': digit,
+        'pick': f'Pick {k}',
+        'in_base': batch[f'in_base_{k}'][i],
+        'in_cross': batch[f'in_cross_{k}'][i],
+        'recent_hits': batch[f'recent_hits_{k}'][i],
+    } for k, digit in enumerate(number, start=1)]
+    return {
+        'number': number,
+        'digits': digits,
+        'structure': _structure(number),
+        'summary': _summary(digits, window),
+    }
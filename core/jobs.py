@@ -0,0 +1,122 @@
+# core/jobs.py
+
+import os
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from core import perf
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# ===================== FILE LOCK =====================
+@contextmanager
+def file_lock(lock_path='data/.update.lock'):
+    """
+    Kunci eksklusif merentas proses (contoh dua instance Streamlit atau cron + UI).
+    Menunggu (blocking) sehingga kunci dilepaskan.
+    """
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    with open(lock_path, 'a+') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+# ===================== SINGLE-FLIGHT JOB =====================
+class Job:
+    """Status satu kerja latar belakang; dikongsi oleh semua pemanggil yang menunggu."""
+
+    def __init__(self, job_id):
+        self.id = job_id
+        self.started = time.time()
+        self.finished = None
+        self.done = 0
+        self.total = 0
+        self.note = ''
+        self.result = None
+        self.error = None
+        self.stats = None  # perf.PerfStats dari thread kerja (span fetch/parse, network_calls)
+        self._event = threading.Event()
+
+    @property
+    def running(self):
+        return not self._event.is_set()
+
+    @property
+    def fraction(self):
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    def report(self, done, total, note=''):
+        self.done, self.total, self.note = done, total, note
+
+    def wait(self, timeout=None):
+        """Tunggu kerja selesai; pulangkan True jika sudah selesai."""
+        return self._event.wait(timeout)
+
+    def _finish(self, result=None, error=None):
+        self.result, self.error = result, error
+        self.finished = time.time()
+        self._event.set()
+
+class SingleFlight:
+    """
+    Jalankan fn paling banyak sekali pada satu masa dalam proses ini.
+
+    submit() semasa kerja masih berjalan akan pulangkan Job yang sama
+    (pemanggil boleh wait() atau poll progress), bukan mula kerja baru.
+    Kerja dijalankan di bawah file_lock supaya proses lain juga tidak bertindih.
+    fn mesti terima argumen kata kunci `progress(done, total, note)`.
+    """
+
+    def __init__(self, fn, lock_path='data/.update.lock'):
+        self.fn = fn
+        self.lock_path = lock_path
+        self._lock = threading.Lock()
+        self._job = None
+        self._count = 0
+
+    def current(self):
+        return self._job
+
+    def submit(self, *args, **kwargs):
+        with self._lock:
+            if self._job is not None and self._job.running:
+                return self._job
+            self._count += 1
+            job = Job(self._count)
+            self._job = job
+        threading.Thread(
+            target=self._run, args=(job, args, kwargs),
+            name=f"single-flight-{job.id}", daemon=True
+        ).start()
+        return job
+
+    def _run(self, job, args, kwargs):
+        try:
+            # Thread ini tiada pengumpul rerun; simpan statistik pada Job untuk pemanggil
+            with perf.collect() as job.stats, file_lock(self.lock_path):
+                result = self.fn(*args, progress=job.report, **kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            job._finish(error=e)
+        else:
+            job._finish(result=result)
@@ -0,0 +1,93 @@
+# core/markov.py
+
+from array import array
+
+class TransitionEngine:
+    """
+    Matriks peralihan digit draw-ke-draw (Markov), dikemas kini secara incremental.
+
+    T[p][a][b] = bilangan kali digit a di posisi p pada draw t diikuti digit b
+    di posisi p pada draw t+1. Dengan cross=True, turut simpan peralihan silang
+    posisi (digit a di posisi p -> digit b di posisi q).
+
+    Storan (tanpa tensor padat per draw):
+      - prefix kiraan digit per posisi (40 integer per draw), untuk tukar
+        sempadan tetingkap kepada rank kemunculan digit a;
+      - untuk setiap (p, a), prefix sum pengganti (10 atau 40 integer) bagi
+        setiap kemunculan.
+    Jadi kiraan peralihan untuk mana-mana tetingkap ialah dua carian indeks,
+    O(1) per posisi, tanpa imbas semula sejarah.
+    """
+
+    def __init__(self, numbers=(), cross=False):
+        self.cross = cross
+        self.width = 40 if cross else 10
+        self.numbers = []
+        self._digits = array('I', [0] * 40)
+        self._succ = [[array('I', [0] * self.width) for _ in range(10)] for _ in range(4)]
+        self.extend(numbers)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def append(self, number):
+        w = self.width
+        if self.numbers:
+            prev = self.numbers[-1]
+            for p in range(4):
+                rows = self._succ[p][int(prev[p])]
+                row = rows[-w:]
+                if self.cross:
+                    for q in range(4):
+                        row[q * 10 + int(number[q])] += 1
+                else:
+                    row[int(number[p])] += 1
+                rows.extend(row)
+        row = self._digits[-40:]
+        for p in range(4):
+            row[p * 10 + int(number[p])] += 1
+        self._digits.extend(row)
+        self.numbers.append(number)
+
+    def extend(self, numbers):
+        for number in numbers:
+            self.append(number)
+
+    def successors(self, p, a, start, stop, q=None):
+        """
+        Kiraan digit pengganti 0-9 (di posisi q, default q=p) bagi draw sumber
+        k dalam [start, stop) yang ada digit a di posisi p. stop <= len - 1.
+        """
+        q = p if q is None else q
+        if q != p and not self.cross:
+            raise ValueError("Peralihan silang posisi perlukan TransitionEngine(cross=True)")
+        w = self.width
+        off = q * 10 if self.cross else 0
+        rows = self._succ[p][a]
+        lo = self._digits[start * 40 + p * 10 + a] * w + off
+        hi = self._digits[stop * 40 + p * 10 + a] * w + off
+        return [rows[hi + b] - rows[lo + b] for b in range(10)]
+
+    def base(self, recent_n=50, stop=None, top=5, cross_weight=0.5):
+        """
+        Base untuk draw selepas numbers[:stop], dari recent_n peralihan terakhir
+        dan digit draw numbers[stop - 1]. Perlu stop >= recent_n + 1.
+
+        Return:
+            list 4 senarai digit (str), disusun ikut skor menurun.
+        """
+        stop = len(self.numbers) if stop is None else stop
+        if stop < recent_n + 1:
+            raise ValueError(f"Perlu sekurang-kurangnya {recent_n + 1} draw (ada {stop}).")
+        start, last = stop - 1 - recent_n, self.numbers[stop - 1]
+        result = []
+        for q in range(4):
+            score = self.successors(q, int(last[q]), start, stop - 1)
+            if self.cross:
+                for p in range(4):
+                    if p != q:
+                        extra = self.successors(p, int(last[p]), start, stop - 1, q)
+                        score = [s + cross_weight * e for s, e in zip(score, extra)]
+            ranked = sorted(range(10), key=lambda b: (-score[b], b))
+            result.append([str(b) for b in ranked[:top]])
+        return result
@@ -0,0 +1,146 @@
+# core/perf.py
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("breakcode4d.perf")
+
+# BREAKCODE4D_PERF_LOG=1 -> log JSON ke stderr; nilai lain dianggap laluan fail
+_target = os.environ.get("BREAKCODE4D_PERF_LOG")
+if _target:
+    _handler = logging.StreamHandler(sys.stderr) if _target == "1" else logging.FileHandler(_target)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+class PerfStats:
+    """Jumlah masa setiap span (kiraan, jumlah saat) dan counter."""
+
+    def __init__(self):
+        self.spans = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, name, seconds):
+        with self._lock:
+            count, total = self.spans.get(name, (0, 0.0))
+            self.spans[name] = (count + 1, total + seconds)
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, other):
+        """Tambah semua span dan counter dari PerfStats lain."""
+        with other._lock:
+            spans, counters = dict(other.spans), dict(other.counters)
+        with self._lock:
+            for name, (count, total) in spans.items():
+                c, t = self.spans.get(name, (0, 0.0))
+                self.spans[name] = (c + count, t + total)
+            for name, n in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def rows(self):
+        """Baris ringkasan, span paling lambat dahulu."""
+        with self._lock:
+            spans = sorted(self.spans.items(), key=lambda kv: -kv[1][1])
+            return [{'span': name, 'count': c, 'total_ms': round(t * 1000, 2)} for name, (c, t) in spans]
+
+# Statistik sejak proses mula (semua sesi)
+TOTALS = PerfStats()
+_local = threading.local()
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+        _local.active = set()
+    return _local.stack
+
+@contextmanager
+def collect():
+    """
+    Kumpul span dan counter dalam thread semasa (contoh satu rerun Streamlit).
+    Boleh bersarang; span direkod ke semua pengumpul yang aktif.
+    """
+    stats = PerfStats()
+    stack = _stack()
+    stack.append(stats)
+    try:
+        yield stats
+    finally:
+        end(stats)
+
+def begin():
+    """
+    Mula pengumpul baharu untuk satu rerun penuh. Pengumpul lama yang
+    tertinggal dalam thread ini (contoh rerun yang dihentikan st.stop) dibuang.
+    """
+    stack = _stack()
+    stack.clear()
+    _local.active.clear()
+    stats = PerfStats()
+    stack.append(stats)
+    return stats
+
+def end(stats):
+    stack = _stack()
+    if stats in stack:
+        stack.remove(stats)
+
+def merge(stats):
+    """
+    Tambah statistik yang dikumpul di thread lain (contoh kerja SingleFlight)
+    ke pengumpul aktif thread semasa. TOTALS sudah merangkumnya.
+    """
+    for collector in _stack():
+        collector.merge(stats)
+
+def cache_summary(stats):
+    """Ringkasan cache: {nama: (hit, panggilan)} dari counter cache_call:* dan cache_miss:*."""
+    out = {}
+    for name, calls in stats.counters.items():
+        if name.startswith('cache_call:'):
+            key = name.split(':', 1)[1]
+            out[key] = (calls - stats.counters.get(f'cache_miss:{key}', 0), calls)
+    return out
+
+def _emit(event):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(event, default=str))
+
+@contextmanager
+def span(name, **fields):
+    """
+    Ukur masa satu peringkat (fetch, parse, load, base, backtest, wheel_filter).
+    Span bersarang dengan nama sama (contoh generate_base rekursif) hanya
+    direkod sekali pada peringkat paling luar.
+    """
+    stack = _stack()
+    if name in _local.active:
+        yield
+        return
+    _local.active.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _local.active.discard(name)
+        TOTALS.add_span(name, elapsed)
+        for stats in stack:
+            stats.add_span(name, elapsed)
+        _emit({'event': 'span', 'name': name, 'ms': round(elapsed * 1000, 3),
+               'thread': threading.current_thread().name, **fields})
+
+def incr(name, n=1, **fields):
+    """Tambah counter (contoh cache_miss:base, network_calls)."""
+    TOTALS.incr(name, n)
+    for stats in _stack():
+        stats.incr(name, n)
+    _emit({'event': 'counter', 'name': name, 'n': n, **fields})
@@ -0,0 +1,182 @@
+# core/store.py
+
+import logging
+import os
+import re
+import threading
+from collections import namedtuple
+from collections.abc import Sequence
+from types import MappingProxyType
+from core.perf import span
+
+logger = logging.getLogger("breakcode4d.store")
+
+# ===================== LOAD & SAVE FILE =====================
+def file_version(file_path):
+    """Versi fail sebagai (mtime_ns, saiz); None jika fail tiada."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def load_draws(file_path='data/draws.txt'):
+    if not os.path.exists(file_path):
+        return []
+    draws = []
+    with span('load', file=file_path), open(file_path, 'r') as f:
+        for line in f:
+            parts = line.strip().split()
+            if len(parts) == 2 and re.match(r"^\d{4}$", parts[1]):
+                draws.append({'date': parts[0], 'number': parts[1]})
+    return draws
+
+def save_base_to_file(base_digits, file_path='data/base.txt'):
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    # Tulis ke fail sementara dan ganti sekaligus, supaya pembaca tidak nampak fail separuh
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        for pick in base_digits:
+            f.write(' '.join(str(d) for d in pick) + '\n')
+    os.replace(tmp_path, file_path)
+
+def load_base_from_file(file_path='data/base.txt'):
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, 'r') as f:
+        return [line.strip().split() for line in f if line.strip()]
+
+# ===================== READ-ONLY VIEW =====================
+class DrawView(Sequence):
+    """
+    Paparan baca-sahaja ke atas sejarah draw yang dikongsi.
+
+    Slicing (contoh draws[:-1], draws[-50:]) tidak menyalin data, hanya
+    mengubah julat. Setiap item ialah mapping baca-sahaja {'date', 'number'}.
+    """
+    __slots__ = ('_items', '_start', '_stop')
+
+    def __init__(self, items, start=0, stop=None):
+        self._items = items
+        self._start = start
+        self._stop = len(items) if stop is None else stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self._items[self._start + i] for i in range(start, stop, step)]
+            return DrawView(self._items, self._start + start, self._start + max(start, stop))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("DrawView index out of range")
+        return self._items[self._start + key]
+
+    def __iter__(self):
+        for i in range(self._start, self._stop):
+            yield self._items[i]
+
+    def __repr__(self):
+        return f"DrawView({len(self)} draws)"
+
+# ===================== SHARED STORE =====================
+DrawSnapshot = namedtuple('DrawSnapshot', [
+    'version',      # versi fail draws.txt semasa dimuat
+    'draws',        # DrawView ke atas semua draw
+    'dates',        # tuple tarikh (tersusun)
+    'numbers',      # tuple nombor 4D
+    'date_index',   # dict tarikh -> indeks
+    'number_set',   # frozenset semua nombor yang pernah naik
+])
+
+def build_snapshot(draws, version=None):
+    items = tuple(MappingProxyType(dict(d)) for d in draws)
+    dates = tuple(d['date'] for d in items)
+    numbers = tuple(d['number'] for d in items)
+    return DrawSnapshot(
+        version=version,
+        draws=DrawView(items),
+        dates=dates,
+        numbers=numbers,
+        date_index={d: i for i, d in enumerate(dates)},
+        number_set=frozenset(numbers),
+    )
+
+class DrawStore:
+    """
+    Satu salinan sejarah draw untuk seluruh proses (dikongsi semua sesi).
+
+    Snapshot hanya dibina semula bila fail berubah: sama ada melalui
+    invalidate() selepas update, atau DataWatcher yang memantau folder data/.
+    """
+
+    def __init__(self, file_path='data/draws.txt', watch=False, interval=2.0):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self.watcher = None
+        if watch:
+            self.watcher = DataWatcher(self, os.path.dirname(file_path) or '.', interval)
+            self.watcher.start()
+
+    def snapshot(self):
+        snap = self._snapshot
+        if snap is None:
+            with self._lock:
+                if self._snapshot is None:
+                    # Laluan fail termasuk dalam versi supaya cache setiap game berasingan
+                    version = (self.file_path, file_version(self.file_path))
+                    self._snapshot = build_snapshot(load_draws(self.file_path), version)
+                snap = self._snapshot
+        return snap
+
+    def invalidate(self):
+        self._snapshot = None
+
+class DataWatcher(threading.Thread):
+    """Pantau fail dalam folder data/ (polling os.stat) dan invalidate store bila berubah."""
+
+    def __init__(self, store, data_dir='data', interval=2.0):
+        super().__init__(name="breakcode4d-data-watcher", daemon=True)
+        self.store = store
+        self.data_dir = data_dir
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._signature = self.signature()
+
+    def signature(self):
+        if not os.path.isdir(self.data_dir):
+            return frozenset()
+        sig = set()
+        with os.scandir(self.data_dir) as entries:
+            for e in entries:
+                # Fail sementara (save atomik) dan kunci update bukan perubahan data
+                if e.name.endswith('.tmp') or e.name == '.update.lock':
+                    continue
+                try:
+                    if not e.is_file():
+                        continue
+                    stat = e.stat()
+                except FileNotFoundError:
+                    # Fail hilang antara scandir dan stat (contoh os.replace)
+                    continue
+                sig.add((e.name, stat.st_mtime_ns, stat.st_size))
+        return frozenset(sig)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                sig = self.signature()
+                if sig != self._signature:
+                    self._signature = sig
+                    self.store.invalidate()
+            except Exception:
+                # Jangan biar thread mati; store tidak akan di-invalidate lagi
+                logger.exception("DataWatcher gagal imbas %s", self.data_dir)
+
+    def stop(self):
+        self._stop_event.set()
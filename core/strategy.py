@@ -0,0 +1,122 @@
+# core/strategy.py
+
+import itertools
+from collections import Counter, defaultdict
+from core.crosspick import CrossPickEngine
+from core.markov import TransitionEngine
+from core.perf import span
+
+STRATEGIES = ['frequency', 'gap', 'hybrid', 'qaisara', 'smartpattern', 'crosspick', 'markov', 'markov_cross']
+
+class NotEnoughDraws(ValueError):
+    """Sejarah draw tidak cukup untuk strategi / recent_n yang diminta."""
+
+class UnknownStrategy(ValueError):
+    """Nama strategi tidak dikenali."""
+
+# ===================== STRATEGY BASE =====================
+def generate_base(draws, method='frequency', recent_n=50):
+    with span('base', method=method, recent_n=recent_n):
+        return _generate_base(draws, method, recent_n)
+
+def _generate_base(draws, method, recent_n):
+    total = len(draws)
+
+    if method == "smartpattern":
+        # Semak minimum keperluan data untuk semua strategi dalam smartpattern
+        if total < 60:
+            raise NotEnoughDraws(
+                f"⚠️ Tidak cukup data untuk strategi `{method}`. "
+                f"Minimum 60 draws diperlukan, tapi hanya {total} draws tersedia."
+            )
+
+        # Tetapan strategi & recent_n untuk setiap posisi (Pick 1–4)
+        setting = [
+            ('qaisara', 60),   # P1
+            ('hybrid', 45),    # P2
+            ('frequency', 50), # P3
+            ('hybrid', 35),    # P4
+        ]
+
+        result = []
+        for i, (strat, n) in enumerate(setting):
+            if total < n:
+                raise NotEnoughDraws(f"❗ Tidak cukup draw untuk Pick {i+1} dengan strategi `{strat}` (perlu {n} draw).")
+            base = generate_base(draws, strat, recent_n=n)
+            result.append(base[i])
+        return result
+
+    # ========= STRATEGI BIASA =========
+    if total < recent_n:
+        raise NotEnoughDraws(
+            f"⚠️ Tidak cukup data untuk strategi `{method}` dengan recent_n={recent_n}. "
+            f"Hanya {total} draw tersedia."
+        )
+
+    recent = [d['number'] for d in draws[-recent_n:]]
+
+    if method == "frequency":
+        freq = [Counter() for _ in range(4)]
+        for number in recent:
+            for i, d in enumerate(number):
+                freq[i][d] += 1
+        return [sorted(freq[i], key=freq[i].get, reverse=True)[:5] for i in range(4)]
+
+    elif method == "hybrid":
+        freq = [Counter() for _ in range(4)]
+        last_digits = [set() for _ in range(4)]
+        for number in recent:
+            for i, d in enumerate(number):
+                freq[i][d] += 1
+                if number == recent[-1]:  # draw terakhir
+                    last_digits[i].add(d)
+        hybrid = []
+        for i in range(4):
+            sorted_digits = sorted(freq[i], key=freq[i].get, reverse=True)
+            combined = [d for d in sorted_digits if d not in last_digits[i]]
+            hybrid.append(combined[:5])
+        return hybrid
+
+    elif method == "qaisara":
+        if total < recent_n:
+            raise NotEnoughDraws(f"❗ Tidak cukup draw untuk strategi qaisara (perlu {recent_n} draw).")
+        base_hybrid = generate_base(draws, "hybrid", recent_n=recent_n)
+        base_freq = generate_base(draws, "frequency", recent_n=recent_n)
+
+        qaisara = []
+        for i in range(4):
+            score = defaultdict(int)
+            for idx, d in enumerate(base_freq[i]):
+                score[d] += (5 - idx)
+            for idx, d in enumerate(base_hybrid[i]):
+                score[d] += (5 - idx)
+            sorted_score = sorted(score.items(), key=lambda x: x[1], reverse=True)
+            selected = [d for d, _ in sorted_score]
+            if len(selected) >= 7:
+                selected = selected[1:-1]  # buang top 1 & bottom 1
+            qaisara.append(selected[:5])
+        return qaisara
+
+    elif method == "crosspick":
+        # Digit kerap di setiap pick bila digit draw terakhir muncul di pick lain,
+        # dikira atas recent_n draw sebelum draw terakhir
+        if total < recent_n + 1:
+            raise NotEnoughDraws(f"❗ Tidak cukup draw untuk strategi crosspick (perlu {recent_n + 1} draw).")
+        engine = CrossPickEngine(d['number'] for d in draws[-(recent_n + 1):-1])
+        return engine.base(draws[-1]['number'], top=5)
+
+    elif method in ("markov", "markov_cross"):
+        # Peralihan digit draw-ke-draw atas recent_n peralihan terakhir
+        if total < recent_n + 1:
+            raise NotEnoughDraws(f"❗ Tidak cukup draw untuk strategi {method} (perlu {recent_n + 1} draw).")
+        engine = TransitionEngine((d['number'] for d in draws[-(recent_n + 1):]),
+                                  cross=(method == "markov_cross"))
+        return engine.base(recent_n)
+
+    else:
+        raise UnknownStrategy(f"Strategi tidak dikenali: {method}")
+
+# ===================== PREDICTION DETERMINISTIK =====================
+def generate_predictions_from_base(base, max_preds=10):
+    combos = [''.join(p) for p in itertools.product(*base)]
+    return combos[:max_preds]
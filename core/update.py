@@ -0,0 +1,88 @@
+# core/update.py
+
+import os
+import requests
+from datetime import datetime, timedelta
+from bs4 import BeautifulSoup
+from core.games import DEFAULT_GAME, GAMES
+from core.perf import incr, span
+from core.store import load_draws, save_base_to_file
+from core.strategy import generate_base
+
+# ===================== UPDATE DRAW =====================
+def extract_1st_prize(html, span_id="1stPz"):
+    soup = BeautifulSoup(html, "html.parser")
+    prize_tag = soup.find("span", id=span_id)
+    if prize_tag and prize_tag.text.strip().isdigit() and len(prize_tag.text.strip()) == 4:
+        return prize_tag.text.strip()
+    return None
+
+def get_1st_prize(date_str, url_template, session=None, extract=None):
+    url = url_template.format(date=date_str)
+    try:
+        incr('network_calls')
+        with span('fetch', date=date_str):
+            resp = (session or requests).get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+        if resp.status_code != 200:
+            print(f"❌ Status bukan 200 untuk {date_str}: {resp.status_code}")
+            return None
+        with span('parse', date=date_str):
+            prize = (extract or extract_1st_prize)(resp.text)
+        if prize:
+            return prize
+        else:
+            print(f"❌ Tidak jumpa 1st Prize untuk {date_str}")
+            return None
+    except requests.RequestException as e:
+        print(f"❌ Ralat semasa request untuk {date_str}: {e}")
+        return None
+
+def update_draws(file_path='data/draws.txt', max_days_back=181, progress=None, url_template=None, extract=None):
+    # URL sumber didaftarkan dalam core.games; None = game default
+    url_template = url_template or GAMES[DEFAULT_GAME].url_template
+    data_dir = os.path.dirname(file_path)
+    base_path = os.path.join(data_dir, 'base.txt')
+    base_last_path = os.path.join(data_dir, 'base_last.txt')
+
+    draws = load_draws(file_path)
+    existing_dates = set(d['date'] for d in draws)
+    last_date = (datetime.today() - timedelta(max_days_back)
+                 if not draws else datetime.strptime(draws[-1]['date'], "%Y-%m-%d"))
+    yesterday = datetime.today() - timedelta(days=1)
+    current = last_date + timedelta(days=1)
+    total_days = max(0, (yesterday.date() - current.date()).days + 1)
+    added = []
+
+    # LANGKAH 1: Jana base_last.txt dari draw SEMALAM
+    if len(draws) >= 51:
+        base_sebelum = generate_base(draws[:-1], method='frequency', recent_n=50)
+        save_base_to_file(base_sebelum, base_last_path)
+    else:
+        if os.path.exists(base_last_path):
+            os.remove(base_last_path)
+
+    # LANGKAH 2: Tambah draw baru (jika ada); satu session HTTP untuk semua tarikh
+    os.makedirs(data_dir or '.', exist_ok=True)
+    with open(file_path, 'a') as f, requests.Session() as session:
+        while current.date() <= yesterday.date():
+            date_str = current.strftime("%Y-%m-%d")
+            if progress:
+                progress((current.date() - last_date.date()).days - 1, total_days, date_str)
+            if date_str in existing_dates:
+                current += timedelta(days=1)
+                continue
+            prize = get_1st_prize(date_str, url_template, session, extract)
+            if prize:
+                f.write(f"{date_str} {prize}\n")
+                added.append({'date': date_str, 'number': prize})
+            current += timedelta(days=1)
+    if progress:
+        progress(total_days, total_days, "Jana base")
+
+    # LANGKAH 3: Jana base.txt dari draw terkini
+    draws = load_draws(file_path)
+    if len(draws) >= 50:
+        base_terkini = generate_base(draws, method='frequency', recent_n=50)
+        save_base_to_file(base_terkini, base_path)
+
+    return f"✔ {len(added)} draw baru ditambah." if added else "✔ Tiada draw baru ditambah."
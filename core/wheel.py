@@ -0,0 +1,40 @@
+# core/wheel.py
+
+from core.perf import span
+
+ASCENDING = ["0123", "1234", "2345", "3456", "4567", "5678", "6789"]
+
+def generate_wheel(base, lot="0.10"):
+    """Semua kombinasi 4D dari base 4 pick, format 'nombor#####lot'."""
+    combos = []
+    for a in base[0]:
+        for b in base[1]:
+            for c in base[2]:
+                for d in base[3]:
+                    combos.append(f"{a}{b}{c}{d}#####{lot}")
+    return combos
+
+def apply_filters(combos, draws, nr, nt, npair, na, uh, sl, likes, dislikes, past=None):
+    with span('wheel_filter', combos=len(combos)):
+        return _apply_filters(combos, draws, nr, nt, npair, na, uh, sl, likes, dislikes, past)
+
+def _apply_filters(combos, draws, nr, nt, npair, na, uh, sl, likes, dislikes, past):
+    # past: set nombor yang pernah naik (contoh DrawSnapshot.number_set) supaya tidak dibina semula
+    if past is None:
+        past = {d['number'] for d in draws}
+    last = draws[-1]['number'] if draws else "0000"
+    out = []
+    for e in combos:
+        num, e_lot = e.split("#####")
+        digs = list(num)
+        if nr and len(set(digs)) < 4: continue
+        if nt and any(digs.count(d) >= 3 for d in digs): continue
+        if npair and any(digs.count(d) == 2 for d in set(digs)): continue
+        if na and num in ASCENDING: continue
+        if uh and num in past: continue
+        sim = sum(1 for a, b in zip(num, last) if a == b)
+        if sim > sl: continue
+        if likes and not any(d in likes for d in digs): continue
+        if dislikes and any(d in dislikes for d in digs): continue
+        out.append(e)
+    return out